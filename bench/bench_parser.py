@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+# 파서 엔진 동등성 검사 + 속도 비교
+#   python bench/bench_parser.py                       # .cache/saramin 에 녹화된 응답 사용 (없으면 가짜 페이지)
+#   python bench/bench_parser.py --pages-dir DIR -n 20
+import sys, json, time, argparse
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT)); sys.path.insert(0, str(Path(__file__).resolve().parent))
+from parsers import PARSERS, available_parsers
+from fake_saramin import load_seed_rows, render_page
+
+# 엔진별 차이가 나기 쉬운 마크업 모음 (엔티티, 주석, 중첩 span, 회사명 누락, 제목 없는 항목)
+EDGE_PAGE = """
+<div class="item_recruit" value=" 1 "><h2 class="job_tit"><a href="/zf_user/jobs/relay/view?rec_idx=1&amp;x=1"><span>R&amp;D&nbsp;센터 <b>신입</b></span><!-- ad --></a></h2>
+  <div class="job_condition"><span><a>서울 강남구</a> <a>외</a></span><span>신입 · 경력</span></div>
+  <div class="job_date"><span class="date">~ 12/01(월)</span><span class="reg">등록일</span></div></div>
+<div class="item_recruit" value="2"><h2 class="job_tit"><a href="https://example.com/x">외부 링크</a></h2>
+  <div class="area_corp"><strong class="corp_name"><a>㈜ 에이 </a><span>비</span></strong></div>
+  <div class="job_condition"><span>부산<span>해운대</span></span><span>경력무관</span><span>대졸↑</span><span>정규직</span></div></div>
+<div class="item_recruit" value="3"><div class="job_tit">제목 없음</div></div>
+<div class="item_recruit other" value="4"><h2 class="job_tit x"><a href="/a">클래스 여러개</a></h2><strong class="corp_name big">회사</strong></div>
+"""
+
+def load_pages(pages_dir):
+    files = sorted(Path(pages_dir).glob("*.json")) if pages_dir else []
+    pages = []
+    for f in files:
+        try: pages.append(json.loads(f.read_text(encoding="utf-8")).get("innerHTML", ""))
+        except ValueError: pass
+    if not pages:
+        seed = load_seed_rows()
+        pages = [render_page(seed, 2000, p, 40) for p in range(1, 51)]
+        print(f"ℹ️ 녹화된 응답 없음 → 가짜 페이지 {len(pages)}개 사용")
+    else:
+        print(f"ℹ️ 녹화된 응답 {len(pages)}개 사용 ({pages_dir})")
+    return pages + [EDGE_PAGE]
+
+def strip_ts(jobs):
+    return [j._replace(crawled_at="") for j in jobs]
+
+def run(name, html):
+    return list(PARSERS[name](html))
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--pages-dir", default=str(ROOT / ".cache/saramin"))
+    ap.add_argument("-n", type=int, default=5, help="반복 횟수")
+    a = ap.parse_args()
+
+    pages = load_pages(a.pages_dir)
+    engines = available_parsers()
+    base = [strip_ts(run("bs4", h)) for h in pages]
+    ok = True
+    for name in engines:
+        got = [strip_ts(run(name, h)) for h in pages]
+        same = got == base
+        ok &= same
+        t0 = time.perf_counter()
+        for _ in range(a.n):
+            for h in pages: run(name, h)
+        dt = (time.perf_counter() - t0) / a.n
+        print(f"{'✅' if same else '❌'} {name:10s} {dt*1000:8.1f} ms/run  {len(pages)/dt:8.1f} pages/sec")
+        if not same:
+            for i, (g, b) in enumerate(zip(got, base)):
+                if g != b: print(f"   첫 불일치 페이지 #{i}:\n   {name}: {g[:1]}\n   bs4: {b[:1]}"); break
+    sys.exit(0 if ok else 1)
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+# score_job(행 단위 apply) vs score_frame(일괄) 결과 동일성 + 속도 비교
+#   python bench/bench_score.py --rows 100000
+import sys, time, argparse
+from pathlib import Path
+from datetime import datetime
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT)); sys.path.insert(0, str(Path(__file__).resolve().parent))
+from test import score_job, score_frame
+from synth import synth_jobs
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--rows", type=int, default=100_000)
+    a = ap.parse_args()
+    now = datetime.now()
+    df = synth_jobs(a.rows, now)
+
+    t0 = time.perf_counter(); old = df.apply(score_job, axis=1, now=now); t_old = time.perf_counter() - t0
+    t0 = time.perf_counter(); new = score_frame(df, now=now); t_new = time.perf_counter() - t0
+    same = (old.to_numpy() == new.to_numpy()).all()
+    print(f"rows={len(df):,}  apply(score_job) {t_old:7.3f}s  score_frame {t_new:7.3f}s  → x{t_old/t_new:5.1f}")
+    print("✅ 결과 동일" if same else f"❌ 불일치 {(old != new).sum()}행")
+    sys.exit(0 if same else 1)
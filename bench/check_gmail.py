@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+# Gmail 지원완료 조회 점검 (bench/fake_gmail.py, 네트워크 없음)
+#   python bench/check_gmail.py
+# 배치/페이지네이션 왕복 횟수, historyId 증분·만료 시 전체 검색 전환, 조회 실패 메일 재시도, 메일 받은 시각을 확인
+import sys, math, tempfile
+from pathlib import Path
+from datetime import datetime
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT)); sys.path.insert(0, str(Path(__file__).resolve().parent))
+import gmail_sync
+from fake_gmail import FakeGmailService
+
+results = []
+
+def check(name, ok, detail=""):
+    results.append(ok)
+    print(f"{'✅' if ok else '❌'} {name:40s} {detail}")
+
+def applied(company):
+    return f"[사람인] (주){company}에 입사지원이 성공적으로 완료되었습니다."
+
+# ===== 전체 조회: messages.list 페이지네이션 + metadata 배치 =====
+N = 1200
+svc = FakeGmailService([applied(f"회사{i}") if i % 3 else f"광고 메일 {i}" for i in range(N)])
+companies = gmail_sync.applied_companies(svc)
+expect_trips = math.ceil(N / 500) + math.ceil(N / gmail_sync.BATCH_SIZE)
+check("applied_companies 결과", len(companies) == N - math.ceil(N / 3) and companies[0] == "(주)회사1199",
+      f"{len(companies)}건, 첫 번째 {companies[0]}")
+check("왕복 횟수 = 목록 페이지 + 배치", svc.round_trips == expect_trips, f"{svc.round_trips} (기대 {expect_trips})")
+check("본문 없이 metadata 만 조회", svc.fetched == {"metadata": N}, f"{svc.fetched}")
+
+# ===== historyId 체크포인트 증분 동기화 =====
+with tempfile.TemporaryDirectory() as d:
+    cp = str(Path(d) / "gmail_checkpoint.json")
+    svc = FakeGmailService()
+    svc.add(applied("가"), datetime(2025, 11, 1, 9, 0))
+    svc.add("광고 메일", datetime(2025, 11, 1, 10, 0))
+    svc.add(applied("가"), datetime(2025, 11, 5, 9, 0))
+    got = gmail_sync.sync_applied(svc, cp)
+    check("첫 동기화: 전체 검색", got == {"(주)가": "2025-11-01 09:00:00"}, f"{got}")
+
+    svc.round_trips = 0
+    svc.add(applied("나"), datetime(2025, 11, 6, 9, 0)); svc.add("광고 메일 2")
+    got = gmail_sync.sync_applied(svc, cp)
+    check("증분: history.list 1번 + 배치 1번", svc.round_trips == 2 and "(주)나" in got, f"왕복 {svc.round_trips}, {list(got)}")
+
+    svc.round_trips = 0; n_fetched = svc.fetched["metadata"]
+    got = gmail_sync.sync_applied(svc, cp)
+    check("새 메일 없으면 history.list 1번만", svc.round_trips == 1 and svc.fetched["metadata"] == n_fetched,
+          f"왕복 {svc.round_trips}")
+
+    # 조회에 실패한 메일은 historyId 가 넘어가도 다음 실행에서 다시 조회
+    mid = svc.add(applied("다"), datetime(2025, 11, 7, 9, 0))
+    msg = svc.by_id.pop(mid)
+    got = gmail_sync.sync_applied(svc, cp)
+    pending = gmail_sync.load_checkpoint(cp)["pending"]
+    check("조회 실패 메일은 pending 으로 남김", "(주)다" not in got and pending == [mid], f"pending={pending}")
+    svc.by_id[mid] = msg
+    got = gmail_sync.sync_applied(svc, cp)
+    check("다음 실행에서 다시 조회해 반영", got.get("(주)다") == "2025-11-07 09:00:00" and
+          not gmail_sync.load_checkpoint(cp)["pending"], f"{got.get('(주)다')}")
+
+    # historyId 가 너무 오래되면(404) 전체 검색으로 전환, 이미 처리한 메일은 다시 받지 않음
+    svc.expire_history()
+    svc.add(applied("라"), datetime(2025, 11, 8, 9, 0))
+    n_fetched = svc.fetched["metadata"]
+    got = gmail_sync.sync_applied(svc, cp)
+    check("historyId 만료 → 전체 검색", "(주)라" in got and len(got) == 4, f"{list(got)}")
+    check("전체 검색에서도 새 메일만 조회", svc.fetched["metadata"] - n_fetched == 1,
+          f"{svc.fetched['metadata'] - n_fetched}건")
+    check("지원 시각은 회사별 가장 이른 메일", got["(주)가"] == "2025-11-01 09:00:00", got["(주)가"])
+
+sys.exit(0 if all(results) else 1)
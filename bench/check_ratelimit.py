@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+# 속도 제한/재시도 경로 점검 (가짜 사람인 서버, 네트워크 없음)
+#   python bench/check_ratelimit.py
+# 429(limit_rps) · 503(error_rate) · 빈 페이지(empty_rate) 가 섞여도 결과가 잘리지 않는지,
+# 끝까지 빈 페이지면 RequestFailed 로 멈추는지, 4xx 응답이 속도를 올리지 않는지 확인
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT)); sys.path.insert(0, str(Path(__file__).resolve().parent))
+import ratelimit
+import test
+from test import SaraminCrawler, METRICS
+from fake_saramin import start_server
+
+TOTAL = 1200   # 30페이지 — 확률로 넣는 오류가 한 번도 안 나올 일이 없도록
+results = []
+
+def check(name, ok, detail=""):
+    results.append(ok)
+    print(f"{'✅' if ok else '❌'} {name:38s} {detail}")
+
+def crawl(**faults):
+    srv, url = start_server(total=TOTAL, **faults)
+    try:
+        c = SaraminCrawler(workers=4, delay=0.01, api_url=url, parse_procs=0, retries=6)
+        try:
+            df = c.crawl_all()
+            return len(df), srv.stats, None
+        except ratelimit.RequestFailed as e:
+            return None, srv.stats, e
+    finally:
+        srv.shutdown()
+
+n, st, _ = crawl(limit_rps=5)
+check("429 (limit_rps) 뒤에도 전체 수집", n == TOTAL and st["429"] > 0, f"rows={n} 429={st['429']}")
+n, st, _ = crawl(error_rate=0.2)
+check("503 (error_rate) 재시도 후 전체 수집", n == TOTAL and st["503"] > 0, f"rows={n} 503={st['503']}")
+before = METRICS.counters.get("empty_page_retries", 0)
+test.EMPTY_PAGE_RETRIES = 4   # 같은 페이지가 연달아 빈 확률을 충분히 낮게 (0.1^5)
+n, st, _ = crawl(empty_rate=0.1)
+retried = METRICS.counters.get("empty_page_retries", 0) - before
+check("빈 페이지(empty_rate) 다시 받아 전체 수집", n == TOTAL and st["empty"] > 0 and retried > 0,
+      f"rows={n} empty={st['empty']} retries={retried}")
+n, st, err = crawl(empty_rate=1.0)
+check("계속 빈 페이지면 RequestFailed", err is not None, f"{err}")
+
+# 4xx(차단 페이지)는 성공으로 치지 않음 — 속도가 그대로여야 함
+class _Resp:
+    def __init__(self, code): self.status_code, self.headers = code, {}
+
+class _Session:
+    def __init__(self, code): self.code = code
+    def request(self, *a, **kw): return _Resp(self.code)
+
+for code, grows in [(200, True), (403, False), (404, False)]:
+    lim = ratelimit.AdaptiveLimiter(rate=100, max_rate=1000, step=10)
+    ratelimit.request(_Session(code), "GET", "http://x", lim)
+    check(f"HTTP {code} 뒤 속도 {'증가' if grows else '유지'}", (lim.rate > 100) == grows, f"rate={lim.rate}")
+
+sys.exit(0 if all(results) else 1)
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+# googleapiclient gmail v1 의 필요한 부분만 흉내 낸 로컬 가짜 서비스 (네트워크 없음)
+#   svc = FakeGmailService(["[사람인] (주)에이에 입사지원이 완료되었습니다.", ...])
+#   gmail_sync.applied_companies(svc); svc.round_trips  → HTTP 왕복 횟수
+from datetime import datetime
+
+class _Req:
+    def __init__(self, svc, fn):
+        self.svc, self.fn = svc, fn
+    def execute(self):
+        self.svc.round_trips += 1
+        return self.fn()
+
+class _Batch:
+    def __init__(self, svc, callback):
+        self.svc, self.callback, self.reqs = svc, callback, []
+    def add(self, req, request_id=None, callback=None):
+        if len(self.reqs) >= 100: raise ValueError("batch 최대 100개")
+        self.reqs.append((request_id or str(len(self.reqs)), req, callback or self.callback))
+    def execute(self):
+        self.svc.round_trips += 1
+        for rid, req, cb in self.reqs:
+            try: cb(rid, req.fn(), None)
+            except Exception as e: cb(rid, None, e)
+
+class _Messages:
+    def __init__(self, svc): self.svc = svc
+    def list(self, userId, q=None, maxResults=100, pageToken=None, **kw):
+        def run():
+            start = int(pageToken or 0)
+            ids = [m["id"] for m in self.svc.messages][start:start+maxResults]
+            res = {"messages": [{"id": i, "threadId": i} for i in ids], "resultSizeEstimate": len(ids)}
+            if start + maxResults < len(self.svc.messages): res["nextPageToken"] = str(start + maxResults)
+            return res
+        return _Req(self.svc, run)
+    def get(self, userId, id, format="full", metadataHeaders=None, **kw):
+        def run():
+            m = self.svc.by_id.get(id)
+            if m is None: raise KeyError(f"404 {id}")
+            headers = [{"name": "Subject", "value": m["subject"]}, {"name": "From", "value": "saramin@saramin.co.kr"}]
+            if format == "metadata" and metadataHeaders:
+                headers = [h for h in headers if h["name"] in metadataHeaders]
+            msg = {"id": id, "historyId": m["historyId"], "internalDate": m["internalDate"], "payload": {"headers": headers}}
+            if format == "full": msg["payload"]["body"] = {"data": "x" * 2000}
+            self.svc.fetched[format] = self.svc.fetched.get(format, 0) + 1
+            return msg
+        return _Req(self.svc, run)
+
+class HistoryGone(Exception):
+    # googleapiclient.errors.HttpError 처럼 resp.status 를 가짐
+    def __init__(self):
+        super().__init__("404 startHistoryId too old")
+        self.resp = type("Resp", (), {"status": 404})()
+
+class _History:
+    def __init__(self, svc): self.svc = svc
+    def list(self, userId, startHistoryId, historyTypes=None, maxResults=100, pageToken=None, **kw):
+        def run():
+            start = int(startHistoryId)
+            if start < self.svc.oldest_history: raise HistoryGone()
+            added = sorted((m for m in self.svc.messages if int(m["historyId"]) > start), key=lambda m: int(m["historyId"]))
+            off = int(pageToken or 0)
+            page = added[off:off+maxResults]
+            res = {"history": [{"id": m["historyId"], "messagesAdded": [{"message": {"id": m["id"]}}]} for m in page],
+                   "historyId": str(self.svc.history_id)}
+            if off + maxResults < len(added): res["nextPageToken"] = str(off + maxResults)
+            return res
+        return _Req(self.svc, run)
+
+class _Users:
+    def __init__(self, svc): self.svc = svc
+    def messages(self): return _Messages(self.svc)
+    def history(self): return _History(self.svc)
+    def getProfile(self, userId):
+        return _Req(self.svc, lambda: {"emailAddress": "me@example.com", "historyId": str(self.svc.history_id)})
+
+class FakeGmailService:
+    def __init__(self, subjects=()):
+        self.messages, self.by_id = [], {}
+        self.round_trips, self.fetched, self.history_id, self.oldest_history = 0, {}, 1000, 0
+        for s in subjects: self.add(s)
+
+    # 새 메일 도착 (목록은 최신순). received: 받은 시각 (datetime, 기본 지금)
+    def add(self, subject, received=None):
+        self.history_id += 1
+        ms = int((received or datetime.now()).timestamp() * 1000)
+        m = {"id": f"m{self.history_id}", "subject": subject, "historyId": str(self.history_id), "internalDate": str(ms)}
+        self.messages.insert(0, m); self.by_id[m["id"]] = m
+        return m["id"]
+
+    # 이 historyId 이전 기록은 버려진 것으로 (history.list 가 404)
+    def expire_history(self):
+        self.oldest_history = self.history_id
+
+    def users(self): return _Users(self)
+    def new_batch_http_request(self, callback=None): return _Batch(self, callback)
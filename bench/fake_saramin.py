@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+# 사람인 get-recruit-list 엔드포인트 로컬 대역 + 수집 처리량(pages/sec) 측정
+#   python bench/fake_saramin.py --total 8000 --latency 0.15 --workers 8 --delay 0.05
+import sys, csv, json, time, math, html, random, argparse, threading
+from pathlib import Path
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from urllib.parse import urlparse, parse_qs
+
+ROOT = Path(__file__).resolve().parent.parent
+SAMPLE_CSV = next(iter(sorted(ROOT.glob("saramin_results_*.csv"))), None)
+
+# ===== 가짜 공고 데이터 =====
+def load_seed_rows():
+    rows = []
+    if SAMPLE_CSV:
+        with open(SAMPLE_CSV, newline="", encoding="utf-8-sig") as f:
+            rows = list(csv.DictReader(f))
+    if not rows:
+        rows = [{"title": "신입 개발자 채용", "company": "(주)테스트", "location": "서울전체",
+                 "career": "신입", "education": "학력무관", "deadline": "~ 12/31(수)"}]
+    return rows
+
+def render_item(rec_idx, r):
+    e = html.escape
+    return f"""
+    <div class="item_recruit" value="{rec_idx}">
+      <div class="area_job">
+        <h2 class="job_tit"><a href="/zf_user/jobs/relay/view?view_type=search&amp;rec_idx={rec_idx}&amp;searchType=search" title="{e(r['title'])}"><span>{e(r['title'])}</span></a></h2>
+        <div class="job_date"><span class="date">{e(r['deadline'])}</span></div>
+        <div class="job_condition"><span><a href="#">{e(r['location'])}</a></span><span>{e(r['career'])}</span><span>{e(r['education'])}</span><span>정규직</span></div>
+        <div class="job_sector"><a href="#">백엔드/서버개발</a></div>
+      </div>
+      <div class="area_corp"><strong class="corp_name"><a href="/zf_user/company-info/view?csn=0" title="{e(r['company'])}">{e(r['company'])}</a></strong></div>
+    </div>"""
+
+# newest_first: 등록일순(recruitSort=reg_dt) — 가장 나중에 추가된 공고가 1페이지 맨 위
+def render_page(seed, total, page, per_page, base_idx=50000000, newest_first=False):
+    start = (page - 1) * per_page
+    idx = range(start, min(start + per_page, total))
+    if newest_first: idx = [total - 1 - i for i in idx]
+    items = [render_item(base_idx + i, seed[i % len(seed)]) for i in idx]
+    return "".join(items)
+
+# 상세 페이지 (jobs/relay/view) — 요약 dl 만 흉내
+SALARIES = ["회사내규에 따름", "연봉 3,600만원 이상", "면접 후 결정", "연봉 2,800만원", "4,000만원 (협의)"]
+def render_detail(rec_idx):
+    i = int(rec_idx) if str(rec_idx).isdigit() else 0
+    return f"""<html><body><div class="jv_cont jv_summary"><div class="cont">
+      <div class="col"><dl><dt>경력</dt><dd><strong>신입</strong></dd></dl><dl><dt>학력</dt><dd><strong>학력무관</strong></dd></dl>
+      <dl><dt>근무형태</dt><dd><strong>{"정규직" if i % 3 else "계약직 (인턴)"}</strong></dd></dl></div>
+      <div class="col"><dl><dt>급여</dt><dd>{SALARIES[i % len(SALARIES)]} <em>| 주 5일(월~금)</em></dd></dl>
+      <dl><dt>근무지역</dt><dd>서울 전체</dd></dl></div></div></div>
+      <div class="jv_cont jv_howto"><dl class="info_period"><dt>시작일</dt><dd>2025.11.01 00:00</dd>
+      <dt class="end">마감일</dt><dd>2025.12.{1 + i % 28:02d} 23:59</dd></dl></div></body></html>"""
+
+# ===== 로컬 HTTP 서버 =====
+# limit_rps: 초당 요청이 이보다 많으면 429 + Retry-After, error_rate: 이 확률로 503
+# empty_rate: 목록 요청이 이 확률로 200 + 빈 innerHTML (차단/오류 페이지를 흉내)
+# srv.add_postings(n) 으로 실행 중에 새 공고를 늘릴 수 있음 (감시 모드 측정용)
+def make_server(total=8000, latency=0.0, port=0, limit_rps=None, error_rate=0.0, empty_rate=0.0):
+    seed = load_seed_rows()
+    hits, lock = [], threading.Lock()
+    stats = {"ok": 0, "429": 0, "503": 0, "list": 0, "empty": 0}
+    state = {"total": total}
+
+    class Handler(BaseHTTPRequestHandler):
+        def _refuse(self):
+            now = time.monotonic()
+            with lock:
+                if limit_rps:
+                    while hits and hits[0] < now - 1: hits.pop(0)
+                    if len(hits) >= limit_rps:
+                        stats["429"] += 1; return 429
+                    hits.append(now)
+                if error_rate and random.random() < error_rate:
+                    stats["503"] += 1; return 503
+                stats["ok"] += 1
+            return None
+
+        def do_GET(self):
+            u = urlparse(self.path)
+            q = parse_qs(u.query)
+            code = self._refuse()
+            if code:
+                self.send_response(code)
+                self.send_header("Retry-After", "1")
+                self.send_header("Content-Length", "0")
+                self.end_headers(); return
+            if u.path.endswith("/jobs/relay/view"):
+                if latency: time.sleep(latency)
+                body = render_detail(q.get("rec_idx", ["0"])[0]).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body); return
+            if not u.path.endswith("/get-recruit-list"):
+                self.send_error(404); return
+            page = int(q.get("recruitPage", ["1"])[0])
+            per_page = int(q.get("recruitPageCount", ["40"])[0])
+            newest = q.get("recruitSort", [""])[0] == "reg_dt"
+            if latency: time.sleep(latency)
+            with lock:
+                stats["list"] += 1; n = state["total"]
+                empty = empty_rate and random.random() < empty_rate
+                if empty: stats["empty"] += 1
+            html = "" if empty else render_page(seed, n, page, per_page, newest_first=newest)
+            body = json.dumps({"innerHTML": html, "count": f"{n:,}"}, ensure_ascii=False).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    srv = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+    srv.daemon_threads = True
+    srv.stats = stats
+    def add_postings(n):
+        with lock: state["total"] += n
+    srv.add_postings = add_postings
+    return srv
+
+def start_server(**kw):
+    srv = make_server(**kw)
+    threading.Thread(target=srv.serve_forever, daemon=True).start()
+    host, port = srv.server_address
+    return srv, f"http://{host}:{port}/zf_user/search/get-recruit-list"
+
+# ===== 처리량 측정 =====
+def measure(url, workers, delay):
+    sys.path.insert(0, str(ROOT))
+    from test import SaraminCrawler
+    c = SaraminCrawler(workers=workers, delay=delay, api_url=url)
+    t0 = time.perf_counter()
+    df = c.crawl_all()
+    dt = time.perf_counter() - t0
+    pages = math.ceil(len(df) / int(c.params["recruitPageCount"])) if len(df) else 0
+    return pages, len(df), dt
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--total", type=int, default=8000, help="가짜 공고 총 개수 (40개/페이지)")
+    ap.add_argument("--latency", type=float, default=0.15, help="요청당 인위적 지연(초)")
+    ap.add_argument("--workers", type=int, default=8)
+    ap.add_argument("--delay", type=float, default=0.05, help="요청 시작 최소 간격(초)")
+    ap.add_argument("--serve", action="store_true", help="측정 없이 서버만 띄움")
+    ap.add_argument("--port", type=int, default=8765)
+    ap.add_argument("--limit-rps", type=float, help="초당 요청이 이보다 많으면 429")
+    ap.add_argument("--error-rate", type=float, default=0.0, help="이 확률로 503")
+    ap.add_argument("--empty-rate", type=float, default=0.0, help="이 확률로 빈 innerHTML")
+    a = ap.parse_args()
+    faults = dict(limit_rps=a.limit_rps, error_rate=a.error_rate, empty_rate=a.empty_rate)
+
+    if a.serve:
+        srv = make_server(total=a.total, latency=a.latency, port=a.port, **faults)
+        print(f"🚀 http://127.0.0.1:{a.port}/zf_user/search/get-recruit-list  (SARAMIN_API_URL 로 지정)")
+        srv.serve_forever()
+
+    srv, url = start_server(total=a.total, latency=a.latency, **faults)
+    for label, w, d in [("순차", 1, a.delay), (f"동시 x{a.workers}", a.workers, a.delay)]:
+        pages, rows, dt = measure(url, w, d)
+        print(f"📊 {label:8s} pages={pages:4d} rows={rows:6d} {dt:6.2f}s → {pages/dt:6.1f} pages/sec")
+    srv.shutdown()
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+# 벤치마크용 innerHTML 녹화 → bench/fixtures/page_NNN.json
+#   python bench/record_fixtures.py                 # .cache/saramin 에 이미 받아둔 응답을 복사 (네트워크 없음)
+#   python bench/record_fixtures.py --live -n 10    # 사람인에서 n 페이지를 새로 받아 저장
+import sys, json, shutil, argparse
+from pathlib import Path
+
+BENCH = Path(__file__).resolve().parent
+ROOT = BENCH.parent
+FIXTURES = BENCH / "fixtures"
+sys.path.insert(0, str(ROOT))
+
+def from_cache(cache_dir, n):
+    files = sorted(Path(cache_dir).glob("*.json"))[:n]
+    for i, f in enumerate(files, start=1):
+        shutil.copyfile(f, FIXTURES / f"page_{i:03d}.json")
+    return len(files)
+
+def from_live(n):
+    from test import SaraminCrawler
+    c = SaraminCrawler(workers=1)
+    saved = 0
+    for page in range(1, n + 1):
+        data = c._get_page_data(page)
+        if not data.get("innerHTML"): break
+        (FIXTURES / f"page_{page:03d}.json").write_text(
+            json.dumps({"innerHTML": data["innerHTML"], "count": data.get("count", "")}, ensure_ascii=False), encoding="utf-8")
+        saved += 1
+    return saved
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--cache-dir", default=str(ROOT / ".cache/saramin"))
+    ap.add_argument("--live", action="store_true", help="캐시 대신 사람인에 직접 요청")
+    ap.add_argument("-n", type=int, default=20, help="최대 페이지 수")
+    a = ap.parse_args()
+
+    FIXTURES.mkdir(exist_ok=True)
+    for old in FIXTURES.glob("page_*.json"): old.unlink()
+    n = from_live(a.n) if a.live else from_cache(a.cache_dir, a.n)
+    print(f"💾 fixture {n}개 → {FIXTURES}" if n else "⚠️ 녹화할 응답 없음 (--live 또는 --cache-dir 확인)")
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# 오프라인 벤치마크 모음 (네트워크 없이, 기준선 대비 비교)
+#   python bench/run_all.py                                   # 1k/10k/100k 행
+#   python bench/run_all.py --sizes 1000,1000000 --save bench/baseline.json
+#   python bench/run_all.py --baseline bench/baseline.json    # 기준선보다 tolerance 배 이상 느리면 exit 1
+#   python bench/run_all.py -k score                          # 이름에 score 가 들어간 항목만
+# 파서는 bench/fixtures 의 녹화된 innerHTML 을 우선 사용 (없으면 합성 페이지, record_fixtures.py 참고)
+import io, sys, json, time, argparse, tempfile, platform
+from contextlib import redirect_stdout
+from pathlib import Path
+from datetime import datetime
+
+BENCH = Path(__file__).resolve().parent
+ROOT = BENCH.parent
+sys.path.insert(0, str(ROOT)); sys.path.insert(0, str(BENCH))
+import pandas as pd
+import send_kakao
+from test import SaraminCrawler, score_job, score_frame, write_feed
+from search_index import SearchIndex
+from parsers import available_parsers
+from synth import synth_jobs, synth_pages, synth_kakao_items, load_fixture_pages
+
+# 진행 메시지(print)는 버리고 가장 빠른 회차만 사용
+def best_of(fn, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        with redirect_stdout(io.StringIO()):
+            t0 = time.perf_counter(); fn(); best = min(best, time.perf_counter() - t0)
+    return best
+
+# ===== 벤치마크 항목 =====
+# 각 항목: (이름, n) → 실행할 함수 (준비 시간은 측정에서 제외), parse 의 n 은 페이지 수
+def case_parse(engine, pages):
+    c = SaraminCrawler(parser=engine)
+    return lambda: sum(1 for html in pages for _ in c._parse_page(html))
+
+def case_score_apply(df, now):
+    return lambda: df.apply(lambda r: score_job(r, now), axis=1)
+
+def case_score_frame(df, now):
+    return lambda: score_frame(df, now)
+
+def case_score_item(items):
+    fresh = {it["rec_idx"] for it in items[::2]}
+    return lambda: [send_kakao.score_item(it, fresh) for it in items]
+
+def case_build_html(df, tmp, page_size=None):
+    c = SaraminCrawler()
+    return lambda: c.build_html(df, tmp / "bench.html", page_size=page_size)
+
+def case_extract_feed(df, tmp):
+    write_feed(df, tmp / "feed.jsonl")
+    def run():
+        send_kakao.FEED_PATH = str(tmp / "feed.jsonl")
+        return send_kakao.extract_items()
+    return run
+
+def case_extract_html(df, tmp):
+    SaraminCrawler().build_html(df, tmp / "cards.html")
+    def run():
+        send_kakao.FEED_PATH = str(tmp / "missing.jsonl")
+        send_kakao.HTML_PATH = str(tmp / "cards.html")
+        return send_kakao.extract_items()
+    return run
+
+def case_rank_top(items, tmp):
+    send_kakao.DELTA_PATH = str(tmp / "missing_delta.json")
+    def run():
+        for it in items: it["score"] = None
+        return send_kakao.rank_top(items, k=5)
+    return run
+
+# search 의 n 은 색인 문서 수, 한 번에 검색어 × 필터 조합 SEARCH_QUERIES 개를 실행
+SEARCH_TERMS = ["신입직원", "채용형인턴", "개발", "정규직 서울", "공사", "a", "없는검색어"]
+SEARCH_FILTERS = [{}, {"location": "서울"}, {"career": "신입", "within_days": 7}]
+SEARCH_QUERIES = len(SEARCH_TERMS) * len(SEARCH_FILTERS)
+
+def case_search_build(df):
+    return lambda: SearchIndex.build(df)
+
+def case_search(df):
+    idx = SearchIndex.build(df)
+    return lambda: [idx.search(q, **f) for q in SEARCH_TERMS for f in SEARCH_FILTERS]
+
+def plan(sizes, slow_cap, tmp):
+    now = datetime.now()
+    pages = load_fixture_pages()
+    src = "fixtures"
+    if not pages:
+        pages, src = synth_pages(50), "synth"
+    for engine in available_parsers():
+        yield f"parse[{engine},{src}]", len(pages), lambda e=engine: case_parse(e, pages)
+    for n in sizes:
+        df = synth_jobs(n, now)
+        items = synth_kakao_items(n)
+        if n <= slow_cap:
+            yield "score_job(apply)", n, lambda df=df: case_score_apply(df, now)
+        yield "score_frame", n, lambda df=df: case_score_frame(df, now)
+        yield "score_item", n, lambda items=items: case_score_item(items)
+        yield "rank_top", n, lambda items=items: case_rank_top(items, tmp)
+        yield "build_html", n, lambda df=df: case_build_html(df, tmp)
+        if n > 1000:
+            yield "build_html(paged)", n, lambda df=df: case_build_html(df, tmp, page_size=1000)
+        yield "extract_items(feed)", n, lambda df=df: case_extract_feed(df, tmp)
+        if n <= slow_cap:
+            yield "extract_items(html)", n, lambda df=df: case_extract_html(df, tmp)
+        yield "search_index(build)", n, lambda df=df: case_search_build(df)
+        yield f"search({SEARCH_QUERIES} queries)", n, lambda df=df: case_search(df)
+
+if __name__ == "__main__":
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--sizes", default="1000,10000,100000", help="합성 행 수 (쉼표 구분, 1000000 까지 권장)")
+    ap.add_argument("--slow-cap", type=int, default=100000, help="행 단위 기준 구현(apply, HTML 파싱)은 이 크기까지만")
+    ap.add_argument("-n", "--repeat", type=int, default=3, help="반복 횟수 (최솟값 사용)")
+    ap.add_argument("-k", default="", help="이름에 이 문자열이 들어간 항목만")
+    ap.add_argument("--save", help="결과를 JSON 기준선으로 저장")
+    ap.add_argument("--baseline", help="이 기준선과 비교")
+    ap.add_argument("--tolerance", type=float, default=1.25, help="기준선 대비 허용 배수")
+    a = ap.parse_args()
+
+    sizes = [int(x) for x in a.sizes.split(",") if x]
+    base = json.loads(Path(a.baseline).read_text(encoding="utf-8"))["results"] if a.baseline else {}
+    results, slower = {}, []
+    with tempfile.TemporaryDirectory() as d:
+        tmp = Path(d)
+        print(f"{'항목':28s} {'n':>9s} {'초':>9s} {'n/s':>12s} {'기준선 대비':>10s}")
+        for name, n, make in plan(sizes, a.slow_cap, tmp):
+            if a.k and a.k not in name: continue
+            with redirect_stdout(io.StringIO()):
+                fn = make()
+            sec = best_of(fn, a.repeat)
+            key = f"{name}@{n}"
+            results[key] = round(sec, 6)
+            ratio = ""
+            if key in base and base[key] > 0:
+                r = sec / base[key]; ratio = f"x{r:.2f}"
+                if r > a.tolerance: slower.append((key, r)); ratio += " ⚠️"
+            print(f"{name:28s} {n:9,d} {sec:9.4f} {n/sec:12,.0f} {ratio:>10s}")
+
+    if a.save:
+        meta = {"python": platform.python_version(), "pandas": pd.__version__, "machine": platform.machine(),
+                "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
+        Path(a.save).write_text(json.dumps({"meta": meta, "results": results}, ensure_ascii=False, indent=1), encoding="utf-8")
+        print(f"💾 기준선 저장 → {a.save}")
+    if slower:
+        print("❌ 기준선보다 느려진 항목: " + ", ".join(f"{k} x{r:.2f}" for k, r in slower))
+        sys.exit(1)
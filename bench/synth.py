@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+# 벤치마크용 합성 데이터 (행 수를 자유롭게 키울 수 있음, 시드 고정)
+#   synth_jobs(n)        : 크롤러 결과와 같은 컬럼의 DataFrame
+#   synth_pages(n_pages) : get-recruit-list innerHTML 페이로드 목록 (40건/페이지)
+#   synth_kakao_items(n) : send_kakao.extract_items() 가 돌려주는 형태의 dict 목록
+#   load_fixture_pages() : bench/fixtures/*.json 에 녹화된 innerHTML (record_fixtures.py 로 생성)
+import sys, json, random
+from pathlib import Path
+from datetime import datetime, timedelta
+
+BENCH = Path(__file__).resolve().parent
+ROOT = BENCH.parent
+FIXTURES = BENCH / "fixtures"
+sys.path.insert(0, str(ROOT)); sys.path.insert(0, str(BENCH))
+from fake_saramin import load_seed_rows, render_page
+
+DEADLINES = ["", "오늘마감", "내일마감", "채용시", "상시채용", "~ 02/30(월)", "~ 13/01(월)"]
+SALARIES = ["", "", "", "면접 후 결정", "회사내규에 따름", "연봉 3000만원", "연봉 3500~4000만원", "4200만원 (협의)", "월 250"]
+
+def synth_jobs(n, now=None, seed=0):
+    import pandas as pd
+    now = now or datetime.now()
+    rnd = random.Random(seed)
+    base = load_seed_rows()
+    rows = []
+    for i in range(n):
+        r = base[i % len(base)]
+        dd = now + timedelta(days=rnd.randint(-20, 60))
+        crawled = now - timedelta(hours=rnd.randint(0, 96))
+        rows.append({
+            "rec_idx": str(50000000 + i), "title": r["title"], "company": r["company"],
+            "location": r["location"], "career": r["career"], "education": r["education"],
+            "deadline": rnd.choice(DEADLINES) if rnd.random() < 0.3 else dd.strftime("~ %m/%d(월)"),
+            "link": f"https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx={50000000 + i}",
+            "salary": rnd.choice(SALARIES),
+            "crawled_at": crawled.strftime("%Y-%m-%d %H:%M:%S") if rnd.random() < 0.95 else "",
+            "score": rnd.randint(-10, 95), "status": "applied" if rnd.random() < 0.02 else "", "applied_at": "",
+        })
+    return pd.DataFrame(rows)
+
+def synth_pages(n_pages, per_page=40):
+    seed = load_seed_rows()
+    total = n_pages * per_page
+    return [render_page(seed, total, p, per_page) for p in range(1, n_pages + 1)]
+
+def load_fixture_pages():
+    pages = []
+    for f in sorted(FIXTURES.glob("*.json")):
+        pages.append(json.loads(f.read_text(encoding="utf-8")).get("innerHTML", ""))
+    return pages
+
+def synth_kakao_items(n, seed=0):
+    from send_kakao import parse_deadline, format_deadline_display
+    rnd = random.Random(seed)
+    base = load_seed_rows()
+    items = []
+    for i in range(n):
+        r = base[i % len(base)]
+        raw = r["deadline"]
+        dl = parse_deadline(raw)
+        items.append({
+            "title": r["title"], "company": r["company"], "location": r["location"], "job": "(직무정보없음)",
+            "deadline_text": raw, "deadline": dl, "deadline_disp": format_deadline_display(dl, raw),
+            "salary": rnd.choice(SALARIES), "url": "", "rec_idx": str(50000000 + i), "score": None,
+        })
+    return items
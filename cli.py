@@ -0,0 +1,323 @@
+# -*- coding: utf-8 -*-
+# 명령행 진입점 — 단계별 하위 명령
+#   python cli.py crawl [--stream | --incremental | --profiles F] [--enrich] [--db PATH]
+#   python cli.py sync-mail                 # 최신 결과에 지원완료 메일 반영
+#   python cli.py delta                     # 지난 실행 대비 신규/삭제/변경 → docs/delta_latest.json
+#   python cli.py render [--page-size N]    # 최신 결과 → HTML + JSON 피드
+#   python cli.py email                     # 최신 결과 상위 10건 메일
+#   python cli.py notify                    # 카카오톡 알림 (send_kakao.py)
+#   python cli.py run [crawl 옵션]          # crawl → sync-mail → delta → render → email 한 번에 (= python test.py)
+#   python cli.py watch [--interval 300]    # 상주하며 첫 페이지만 확인, 새 공고가 있으면 delta → render (→ notify/email)
+#   python cli.py search "신입직원" [--location 서울 --career 신입 --within-days 7]   # 제목/회사 bigram 검색
+# render/email/notify 에 --delta 를 주면 변경분(신규 + 변경) 공고만 대상으로
+# 단계는 저장된 결과(최신 saramin_results_*.csv, --db 면 DB 의 마지막 실행)만 주고받으므로 따로 다시 돌릴 수 있음
+# --db (또는 SARAMIN_DB 환경 변수)를 주면 SQLite 저장소가 원본: 수집은 DB 에 실행 기록과 함께 upsert 하고
+# CSV 를 남기지 않으며, 지원 상태는 바뀐 행만 UPDATE
+# run --stream 은 후속 단계도 결과 CSV 를 청크로만 읽음: 지원 상태/변경분은 전체 공고, HTML/피드/검색 색인/메일은 상위 top_k
+# (--db 와 함께 쓰면 후속 단계는 DB 의 마지막 실행을 한 번에 읽음 — 메모리 일정은 수집 구간만)
+# 무거운 모듈(pandas, 구글 API 클라이언트, bs4)은 그 단계를 실행할 때만 import
+import os, sys, json, atexit, argparse
+from pathlib import Path
+
+REPORT_PATH = "run_report.json"   # 단계별 시간/처리량 실행 리포트 (metrics.py)
+DELTA_HTML_PATH = "docs/saramin_results_delta.html"
+
+# ===== 단계 =====
+def crawl(args):
+    from test import (SaraminCrawler, ResponseCache, METRICS, CACHE_DIR,
+                      STREAM_CHUNK, clean_old_csv, results_csv_name, score_frame)
+    from enrich import DetailEnricher
+    from job_store import JobStore
+    import pandas as pd
+    cache = ResponseCache(args.cache_dir or CACHE_DIR, args.cache_ttl) if (args.cache_dir or args.replay) else None
+    crawler = SaraminCrawler(cache=cache, replay=args.replay, parser=args.parser, parse_procs=args.parse_procs)
+    store = JobStore(args.db) if args.db else None
+
+    csv_path = results_csv_name()
+    # 저장소를 쓰면 스트리밍 CSV 는 DB 로 옮기기 전까지만 쓰는 임시 파일
+    if store is not None: csv_path = str(Path(args.db).with_name(csv_path.replace("saramin_results_", "stream_")))
+    with METRICS.stage("crawl"):
+        if args.stream:
+            df = crawler.crawl_stream(csv_path, top_k=args.top_k)
+        elif args.profiles:
+            with open(args.profiles, encoding="utf-8") as f:
+                df = crawler.crawl_profiles(json.load(f))
+        elif args.incremental:
+            df = crawler.crawl_incremental(_load(args.db, required=False)[0], stop_after=args.stop_after)
+        else:
+            df = crawler.crawl_all()
+    if df.empty:
+        # 0 이 아닌 종료 코드로 끝내야 워크플로의 다음 단계가 지난 결과로 메일/페이지를 다시 만들지 않음
+        print("❌ 데이터 없음"); sys.exit(1)
+    if args.enrich:
+        # 급여가 채워지면 SALARY_GOOD 가 살아나므로 점수/순서를 다시 계산
+        with METRICS.stage("enrich"):
+            df = DetailEnricher(crawler).enrich(df)
+            df["score"] = score_frame(df)
+            df = df.sort_values("score",ascending=False).reset_index(drop=True)
+    if store is not None:
+        # DB 에 upsert (지원 상태는 이전 실행 값이 그대로 남음) — 결과 파일은 만들지 않음
+        with METRICS.stage("store"):
+            run_id = store.start_run()
+            if args.stream:
+                for chunk in pd.read_csv(csv_path, dtype={"rec_idx": str}, encoding="utf-8-sig", chunksize=STREAM_CHUNK):
+                    store.upsert(chunk, run_id)
+                os.remove(csv_path)
+            else:
+                store.upsert(df, run_id)
+        print(f"✅ DB 저장: {args.db} (run {run_id})")
+        return store.run_name(run_id)
+    if not args.stream:
+        with METRICS.stage("csv_write"):
+            df.to_csv(csv_path,index=False,encoding="utf-8-sig")
+    print(f"✅ CSV 저장: {csv_path}")
+    clean_old_csv()
+    return csv_path
+
+def _latest():
+    from test import latest_csv
+    path = latest_csv()
+    if not path:
+        print("❌ 저장된 결과 CSV 없음 (먼저 crawl 실행)"); sys.exit(1)
+    return path
+
+# 마지막 결과 (df, 이름): --db 면 저장소의 마지막 실행, 아니면 최신 CSV. 없으면 종료 (required=False 면 (None, None))
+def _load(db=None, required=True):
+    from test import latest_csv, load_results_csv, compact_frame
+    if db:
+        from job_store import JobStore
+        store = JobStore(db)
+        run_id = store.last_run()
+        if run_id is not None: return compact_frame(store.current(run_id)), store.run_name(run_id)
+    else:
+        path = latest_csv()
+        if path: return load_results_csv(path), Path(path).name
+    if required:
+        print("❌ 저장된 결과 없음 (먼저 crawl 실행)"); sys.exit(1)
+    return None, None
+
+# 점수의 신선도 항은 변경분(delta)의 신규 공고 기준 — 카카오 알림(send_kakao.rank_top)과 같은 기준
+# 수집 시각 기준이면 전체 수집 뒤엔 모든 공고가 "새 공고"가 되므로, 변경분이 있으면 그것으로 다시 매김
+def _fresh_ids():
+    import delta
+    return delta.fresh_ids(delta.load_delta())
+
+def _rescored(df):
+    ids = _fresh_ids()
+    if ids is None or df.empty: return df
+    from test import score_frame
+    return df.assign(score=score_frame(df, fresh_ids=ids))
+
+# 스트리밍 CSV 는 수집 순서 그대로이므로 점수순으로 정렬하고, top_k 가 있으면 상위만
+def _ranked(df, top_k=None):
+    df = _rescored(df)
+    if top_k: return df.nlargest(top_k, "score", keep="first").reset_index(drop=True)
+    return df.sort_values("score", ascending=False, kind="stable").reset_index(drop=True)
+
+# csv_path: 저장소를 쓰지 않을 때 지원 상태를 반영할 CSV. chunksize 를 주면 청크로 읽고 쓰며 None 반환
+def sync_mail(csv_path=None, db=None, chunksize=None):
+    from test import update_from_mail, METRICS
+    from job_store import JobStore
+    store = JobStore(db) if db else None
+    with METRICS.stage("gmail_sync"):
+        return update_from_mail(None if store else (csv_path or _latest()), store, chunksize)
+
+def compute_delta(df, source):
+    import delta
+    from metrics import METRICS
+    with METRICS.stage("delta"):
+        return delta.update(df, Path(source).name)
+
+# --delta 면 변경분 공고만 남김 (변경분 파일이 없으면 전체)
+def _only_delta(df, on):
+    if not on: return df
+    import delta
+    d = delta.load_delta()
+    if d is None:
+        print("ℹ️ 변경분 없음 → 전체 대상"); return df
+    return delta.delta_only(df, d)
+
+def render(df, page_size=None, delta_only=False):
+    from test import SaraminCrawler, write_feed, FEED_PATH, METRICS
+    if delta_only:
+        # 변경분 전용 페이지 — 전체 결과 페이지/피드는 건드리지 않음
+        with METRICS.stage("render_html"):
+            SaraminCrawler().build_html(df, DELTA_HTML_PATH, page_size=page_size)
+        return
+    with METRICS.stage("render_html"):
+        SaraminCrawler().build_html(df, "docs/saramin_results_latest.html", page_size=page_size)
+    with METRICS.stage("feed"):
+        write_feed(df, FEED_PATH)
+    # Pages 검색 페이지용 색인 (docs/search_index.json + docs/search.html)
+    import search_index
+    with METRICS.stage("search_index"):
+        search_index.publish(df)
+
+def email(df):
+    from test import send_digest_email, METRICS
+    with METRICS.stage("smtp_send"):
+        send_digest_email(df)
+
+# ===== 하위 명령 =====
+def cmd_crawl(args):
+    crawl(args)
+
+def cmd_sync_mail(args):
+    sync_mail(None, args.db)
+
+def cmd_delta(args):
+    compute_delta(*_load(args.db))
+
+def cmd_render(args):
+    df = _only_delta(_ranked(_load(args.db)[0]), args.delta)
+    render(_ranked(df, args.top_k), args.page_size, args.delta)
+
+def cmd_email(args):
+    df = _only_delta(_ranked(_load(args.db)[0]), args.delta)
+    if df.empty:
+        print("📭 변경분 없음 → 메일 건너뜀"); return
+    email(df)
+
+def cmd_notify(args):
+    import send_kakao
+    send_kakao.main(args.delta)
+
+def cmd_run(args):
+    source = crawl(args)
+    if args.stream and not args.db:
+        # 스트리밍 결과는 끝까지 청크로: 지원 상태/델타는 전체 공고, 메모리에 올리는 DataFrame 은 상위 top_k 뿐
+        from test import iter_results_csv, top_results_csv, STREAM_CHUNK
+        sync_mail(source, chunksize=STREAM_CHUNK)
+        compute_delta(iter_results_csv(source, STREAM_CHUNK), source)
+        df = top_results_csv(source, args.top_k, fresh_ids=_fresh_ids())
+    else:
+        df = sync_mail(None if args.db else source, args.db)
+        # 델타는 스트리밍의 top_k 로 자르기 전 전체 결과로
+        compute_delta(df, source)
+        df = _ranked(df, args.top_k if args.stream else None)
+    render(df, args.page_size)
+    email(df)
+
+def cmd_watch(args):
+    from test import SaraminCrawler
+    from watch import Watcher
+    from job_store import JobStore
+    prev = _load(args.db, required=False)[0]
+    crawler = SaraminCrawler(workers=args.workers, delay=args.delay, parser=args.parser)
+
+    def on_change(df, source):
+        compute_delta(df, source)
+        render(_ranked(df), args.page_size)
+        if args.notify:
+            import send_kakao
+            send_kakao.main(delta_only=True)
+        if args.email:
+            changed = _only_delta(df, True)
+            if not changed.empty: email(changed)
+
+    w = Watcher(crawler, prev, interval=args.interval, stop_after=args.stop_after, on_change=on_change,
+                store=JobStore(args.db) if args.db else None)
+    w.run(args.max_cycles)
+
+# 색인이 최신 결과(CSV 또는 DB)보다 새것이면 그대로 읽고, 아니면 결과로 바로 만듦
+def cmd_search(args):
+    import search_index
+    from test import latest_csv
+    path, ix = (args.db or latest_csv()), Path(search_index.INDEX_PATH)
+    if ix.exists() and (not path or ix.stat().st_mtime >= Path(path).stat().st_mtime):
+        idx = search_index.SearchIndex.load(ix)
+    else:
+        idx = search_index.SearchIndex.build(_ranked(_load(args.db)[0]))
+    hits = idx.search(args.query, args.location, args.career, args.within_days, args.limit)
+    if args.json:
+        print(json.dumps(hits, ensure_ascii=False, indent=1)); return
+    if not hits:
+        print(f"🔍 '{args.query}' 결과 없음 ({idx.n}건 중)"); return
+    print(f"🔍 '{args.query}' 상위 {len(hits)}건 ({idx.n}건 중)")
+    for h in hits:
+        print(f"{h['score']:>3} | {h['company']} | {h['title']} | {h['location']} · {h['career']} · {h['deadline']} | {h['link']}")
+
+def build_parser():
+    ap = argparse.ArgumentParser(prog="cli.py", description="사람인 채용공고 수집/알림")
+    sub = ap.add_subparsers(dest="cmd", required=True)
+
+    def db_opt(p):
+        p.add_argument("--db", default=os.getenv("SARAMIN_DB"),
+                       help="SQLite 공고 저장소 경로 (기본: SARAMIN_DB). 지정하면 CSV 대신 DB 가 원본")
+
+    def crawl_opts(p):
+        p.add_argument("--cache-dir", help="응답 캐시 디렉터리 (예: .cache/saramin)")
+        p.add_argument("--cache-ttl", type=int, default=6*3600, help="캐시 유효 시간(초)")
+        p.add_argument("--replay", action="store_true", help="네트워크 없이 캐시된 응답만 사용")
+        p.add_argument("--parser", default="auto", help="HTML 파서 엔진: auto | bs4 | lxml | selectolax")
+        p.add_argument("--parse-procs", type=int, help="파싱 프로세스 수 (0: 받는 스레드에서 파싱, 기본: 20페이지 이상이면 코어 수 - 1)")
+        p.add_argument("--stream", action="store_true", help="페이지 단위로 CSV 에 바로 기록 (메모리 일정, run 은 후속 단계도 청크로)")
+        p.add_argument("--top-k", type=int, default=200, help="--stream 일 때 HTML/피드/검색 색인/메일에 쓸 상위 공고 수")
+        p.add_argument("--incremental", action="store_true", help="등록일순으로 새 공고만 받아 이전 CSV 에 합침")
+        p.add_argument("--stop-after", type=int, default=20, help="--incremental: 연속으로 이미 본 공고가 이만큼 나오면 중단")
+        p.add_argument("--profiles", help='검색 프로필 JSON 파일 {"이름": {"loc_mcd": "...", ...}} — 모두 한 번에 수집')
+        p.add_argument("--enrich", action="store_true", help="상세 페이지에서 급여/근무형태/마감일시 보강 (rec_idx 별 영구 캐시, --stream 과 함께 못 씀)")
+        db_opt(p)
+
+    p = sub.add_parser("crawl", help="수집 → CSV (+ --db)")
+    crawl_opts(p); p.set_defaults(func=cmd_crawl)
+    p = sub.add_parser("sync-mail", help="최신 결과에 Gmail 지원완료 반영")
+    db_opt(p); p.set_defaults(func=cmd_sync_mail)
+    p = sub.add_parser("delta", help="최신 결과와 지난 스냅샷 비교 → docs/delta_latest.json")
+    db_opt(p); p.set_defaults(func=cmd_delta)
+    p = sub.add_parser("render", help="최신 결과 → docs/ HTML + JSON 피드")
+    db_opt(p)
+    p.add_argument("--page-size", type=int, help="HTML 을 페이지당 N건으로 나누고 latest 는 인덱스로 씀")
+    p.add_argument("--top-k", type=int, help="상위 N건만")
+    p.add_argument("--delta", action="store_true", help=f"변경분만 {DELTA_HTML_PATH} 로")
+    p.set_defaults(func=cmd_render)
+    p = sub.add_parser("email", help="최신 결과 상위 10건 메일 발송")
+    db_opt(p)
+    p.add_argument("--delta", action="store_true", help="변경분(신규 + 변경) 공고만")
+    p.set_defaults(func=cmd_email)
+    p = sub.add_parser("notify", help="카카오톡 TOP 5 알림")
+    p.add_argument("--delta", action="store_true", help="변경분(신규 + 변경) 공고만, 없으면 보내지 않음")
+    p.set_defaults(func=cmd_notify)
+    p = sub.add_parser("run", help="crawl → sync-mail → delta → render → email")
+    crawl_opts(p)
+    p.add_argument("--page-size", type=int, help="HTML 을 페이지당 N건으로 나누고 latest 는 인덱스로 씀")
+    p.set_defaults(func=cmd_run)
+    p = sub.add_parser("watch", help="상주 감시: 등록일순 첫 페이지 주기 확인, 새 공고면 후속 단계 실행")
+    p.add_argument("--interval", type=float, default=300, help="확인 간격(초)")
+    p.add_argument("--stop-after", type=int, default=20, help="연속으로 이미 본 공고가 이만큼 나오면 더 내려가지 않음")
+    p.add_argument("--workers", type=int, default=2)
+    p.add_argument("--delay", type=float, default=1.0, help="요청 시작 최소 간격(초)")
+    p.add_argument("--parser", default="auto", help="HTML 파서 엔진: auto | bs4 | lxml | selectolax")
+    p.add_argument("--page-size", type=int, help="HTML 을 페이지당 N건으로 나누고 latest 는 인덱스로 씀")
+    p.add_argument("--notify", action="store_true", help="새 공고가 있으면 카카오톡 (변경분만)")
+    p.add_argument("--email", action="store_true", help="새 공고가 있으면 메일 (변경분만)")
+    p.add_argument("--max-cycles", type=int, help="이만큼 확인하고 종료 (테스트용)")
+    db_opt(p)
+    p.set_defaults(func=cmd_watch)
+    p = sub.add_parser("search", help="제목/회사명 검색 (글자 bigram 색인) + 지역/경력/마감 필터")
+    p.add_argument("query", nargs="?", default="", help="검색어 (비우면 필터만)")
+    p.add_argument("--location", help="지역에 이 글자가 든 공고만 (예: 서울)")
+    p.add_argument("--career", help="경력 조건에 이 글자가 든 공고만 (예: 신입)")
+    p.add_argument("--within-days", type=int, help="오늘부터 N일 안에 마감하는 공고만")
+    p.add_argument("-n", "--limit", type=int, default=20)
+    p.add_argument("--json", action="store_true", help="JSON 으로 출력")
+    db_opt(p)
+    p.set_defaults(func=cmd_search)
+    return ap
+
+def main(argv=None):
+    ap = build_parser()
+    args = ap.parse_args(argv)
+    # 스트리밍은 공고를 받는 즉시 CSV 에 쓰므로 상세 보강(점수 재계산 포함)을 끼울 자리가 없음
+    if getattr(args, "stream", False) and getattr(args, "enrich", False):
+        ap.error("--stream 과 --enrich 는 함께 쓸 수 없음")
+    # send_kakao 는 자기 리포트(kakao_run_report.json)를 씀, search 는 조회만 하므로 리포트 없음
+    if args.cmd not in ("notify", "search"):
+        from metrics import METRICS
+        METRICS.start_profiling()
+        # crawl/run 은 새 리포트, 나머지 단계는 같은 리포트에 덧붙임 — 어떤 경로로 끝나든(exit 포함) 남김
+        atexit.register(METRICS.write, REPORT_PATH, args.cmd not in ("crawl", "run", "watch"))
+    args.func(args)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+# 회사명 정규화 인덱스 — 지원완료 메일의 회사명을 결과 행에 매칭
+#   정규화: (주)/㈜/주식회사 제거, 공백 제거, 소문자
+#   조회: 정규화 이름이 정확히 같은 행 → 없으면 그 이름으로 시작하는 행 (이분 탐색)
+# 부분 문자열 검색(str.contains)과 달리 짧은 회사명이 다른 회사명 중간에 걸리는 오탐이 없음
+import re
+from bisect import bisect_left
+
+_CORP_MARKS = re.compile(r"\(주\)|㈜|주식회사|\s+")
+MIN_PREFIX = 2   # 이보다 짧은 이름은 정확히 일치할 때만
+
+def normalize_company(name):
+    if not isinstance(name, str): return ""
+    return _CORP_MARKS.sub("", name).casefold()
+
+class CompanyIndex:
+    def __init__(self, names):
+        self.rows = {}
+        for pos, name in enumerate(names):
+            key = normalize_company(name)
+            if key: self.rows.setdefault(key, []).append(pos)
+        self.keys = sorted(self.rows)
+
+    def lookup(self, company):
+        key = normalize_company(company)
+        if not key: return []
+        if key in self.rows: return self.rows[key]
+        if len(key) < MIN_PREFIX: return []
+        out, i = [], bisect_left(self.keys, key)
+        while i < len(self.keys) and self.keys[i].startswith(key):
+            out += self.rows[self.keys[i]]; i += 1
+        return out
@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+# 사람인 마감 표기 → 날짜 (test.py 피드, search_index.py 색인 공용)
+# 검색 색인이 크롤러 모듈(파서, Gmail, 상세 보강)을 통째로 불러오지 않도록 따로 둠
+import re
+from datetime import datetime, timedelta
+
+# "~ 11/19(수)" / "오늘마감" / "내일마감" → 마감 날짜 (없으면 None). 반년 넘게 지난 월/일은 내년으로 봄
+def deadline_date(text, now=None):
+    now = now or datetime.now()
+    if not isinstance(text, str) or not text: return None
+    t = text.replace(" ", "")
+    if "오늘마감" in t: return now.date()
+    if "내일마감" in t: return (now + timedelta(days=1)).date()
+    m = re.search(r"(\d{1,2})/(\d{1,2})", t)
+    if not m: return None
+    try:
+        d = datetime(now.year, int(m.group(1)), int(m.group(2)))
+        if d < now - timedelta(days=180): d = datetime(now.year + 1, d.month, d.day)
+    except ValueError:
+        return None
+    return d.date()
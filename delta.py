@@ -0,0 +1,115 @@
+# -*- coding: utf-8 -*-
+# 실행 간 변경분(delta): 이번 결과와 지난 스냅샷을 rec_idx + 내용 해시로 비교
+#   added   : 새로 잡힌 공고
+#   removed : 지난번엔 있었는데 이번엔 없는 공고 (마감/삭제)
+#   changed : 내용 해시가 달라진 공고 — 제목/마감일 변경은 이전 → 이후 값을 같이 기록
+# docs/delta_latest.json 하나가 "새 공고" 판단의 기준 (send_kakao 의 신규 가점, 메일/HTML --delta)
+# 스냅샷은 rec_idx 별 [해시, 제목, 마감일, 회사] 만 보관 → 이전 CSV 가 지워져도 비교 가능
+# rec_idx 가 빈 공고(CSV 를 거치면 NaN)는 실행 간에 같은 공고인지 알 수 없으므로 비교에서 뺌
+import os, json, hashlib
+from datetime import datetime
+from pathlib import Path
+
+DELTA_PATH = "docs/delta_latest.json"
+# 스냅샷은 실행 상태라 공개되는 docs/ 가 아닌 .state/ 에 (워크플로 캐시로 유지)
+SNAPSHOT_PATH = os.path.join(os.getenv("SARAMIN_STATE_DIR", ".state"), "delta_snapshot.json")
+LEGACY_SNAPSHOT_PATH = "docs/delta_snapshot.json"   # 예전 위치 — 한 번 읽고 저장할 때 지움
+HASH_FIELDS = ["title","company","location","career","education","deadline","salary"]
+TRACK_FIELDS = ["title","deadline"]   # 스냅샷에 값을 남겨 변경 전/후를 보여줄 필드
+ITEM_FIELDS = ["rec_idx","title","company","deadline","score","link"]
+
+def _clean(v):
+    return "" if v is None or v != v else str(v)
+
+def content_hash(values):
+    text = "\x1f".join(values)
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+def snapshot(df):
+    cols = df.reindex(columns=["rec_idx"] + HASH_FIELDS)
+    keep = [HASH_FIELDS.index(k) for k in TRACK_FIELDS + ["company"]]
+    out = {}
+    for r in cols.itertuples(index=False, name=None):
+        rec = _clean(r[0])
+        if not rec: continue
+        vals = [_clean(v) for v in r[1:]]
+        out[rec] = [content_hash(vals)] + [vals[i] for i in keep]
+    return out
+
+def _load(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _save(path, obj):
+    p = Path(path); p.parent.mkdir(parents=True, exist_ok=True)
+    tmp = p.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(obj, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp, p)
+
+def _items(df, ids):
+    rows = df[df["rec_idx"].astype(str).isin(ids)].reindex(columns=ITEM_FIELDS)
+    out = {}
+    for r in rows.itertuples(index=False, name=None):
+        it = dict(zip(ITEM_FIELDS, r))
+        sc = it.pop("score")
+        it = {k: _clean(v) for k, v in it.items()}
+        it["score"] = None if sc is None or sc != sc else int(sc)
+        out.setdefault(it["rec_idx"], it)
+    return out
+
+# prev / cur: snapshot() 결과. items: added/changed 공고의 표시용 필드 (_items)
+def diff(prev, cur, items):
+    added = [r for r in cur if r not in prev]
+    removed = [r for r in prev if r not in cur]
+    changed = {}
+    for r, h in cur.items():
+        old = prev.get(r)
+        if old is None or old[0] == h[0]: continue
+        changed[r] = {k: [old[i], h[i]] for i, k in enumerate(TRACK_FIELDS, start=1) if old[i] != h[i]}
+    return {
+        "added": [items[r] for r in added],
+        "removed": [{"rec_idx": r, "title": prev[r][1], "company": prev[r][3]} for r in removed],
+        "changed": [dict(items[r], changes=f) for r, f in changed.items()],
+    }
+
+# 결과(df)로 스냅샷을 갱신하고 변경분을 기록. 같은 결과(source)로 다시 실행하면 지난 delta 를 그대로 돌려줌
+# df 는 DataFrame 또는 그 청크들(스트리밍 결과) — 청크마다 스냅샷을 모으고 신규/변경 항목도 그 청크에서 꺼냄
+def update(df, source, snapshot_path=SNAPSHOT_PATH, delta_path=DELTA_PATH):
+    source = str(source)
+    snap = _load(snapshot_path) or {}
+    if not snap and snapshot_path == SNAPSHOT_PATH: snap = _load(LEGACY_SNAPSHOT_PATH) or {}
+    if snap.get("source") == source:
+        d = load_delta(delta_path)
+        if d is not None:
+            print(f"ℹ️ 변경분 이미 계산됨 ({source})"); return d
+    prev, cur, items = snap.get("rows", {}), {}, {}
+    for part in ([df] if hasattr(df, "itertuples") else df):
+        s = snapshot(part)
+        want = {r for r, h in s.items() if r not in prev or prev[r][0] != h[0]}
+        for r, it in _items(part, want).items(): items.setdefault(r, it)
+        cur.update(s)
+    d = diff(prev, cur, items)
+    d.update(generated_at=datetime.now().strftime("%Y-%m-%d %H:%M:%S"), source=source,
+             previous=snap.get("source"), baseline=not snap,
+             counts={k: len(d[k]) for k in ("added", "removed", "changed")}, total=len(cur))
+    _save(delta_path, d)
+    _save(snapshot_path, {"source": source, "at": d["generated_at"], "rows": cur})
+    if snapshot_path == SNAPSHOT_PATH and os.path.exists(LEGACY_SNAPSHOT_PATH): os.remove(LEGACY_SNAPSHOT_PATH)
+    c = d["counts"]
+    print(f"✅ 변경분 → {delta_path} (신규 {c['added']} · 삭제 {c['removed']} · 변경 {c['changed']})")
+    return d
+
+def load_delta(path=None):
+    return _load(path or DELTA_PATH)
+
+def fresh_ids(d):
+    return {it["rec_idx"] for it in d["added"]} if d else None
+
+# 변경분에 든 공고(신규 + 변경)만 남긴 결과 — 메일/HTML 을 delta 로만 만들 때
+def delta_only(df, d):
+    ids = {it["rec_idx"] for it in d["added"] + d["changed"]} if d else set()
+    return df[df["rec_idx"].astype(str).isin(ids)].reset_index(drop=True)
@@ -0,0 +1,92 @@
+# -*- coding: utf-8 -*-
+# 상세 페이지(jobs/relay/view?rec_idx=) 보강: 급여, 근무형태, 정확한 마감일시
+#   - 크롤러의 세션/속도 예산을 그대로 쓰고, 워커 수만큼만 동시에 요청
+#   - rec_idx 별 결과를 파일 캐시에 영구 보관 → 공고 하나당 상세 페이지는 평생 한 번만 받음
+import os, re, json, threading
+from datetime import datetime, timedelta
+from concurrent.futures import ThreadPoolExecutor
+
+DETAIL_URL = os.getenv("SARAMIN_DETAIL_URL", "https://www.saramin.co.kr/zf_user/jobs/relay/view")
+# 실행 상태라 공개되는 docs/ 가 아닌 .state/ 에 (워크플로 캐시로 유지)
+DETAIL_CACHE_PATH = os.path.join(os.getenv("SARAMIN_STATE_DIR", ".state"), "detail_cache.json")
+LEGACY_CACHE_PATH = "docs/detail_cache.json"   # 예전 위치 — 한 번 읽고 저장할 때 지움
+DETAIL_FIELDS = ["salary", "employment_type", "deadline_full"]
+
+# ===== 상세 페이지 파싱 =====
+_DL_RE = re.compile(r"<dt[^>]*>(.*?)</dt>\s*<dd[^>]*>(.*?)</dd>", re.S)
+_TAG_RE = re.compile(r"<[^>]+>")
+
+def _clean(s):
+    from html import unescape
+    return re.sub(r"\s+", " ", unescape(_TAG_RE.sub(" ", s))).strip()
+
+def parse_detail(html):
+    pairs = {}
+    for dt, dd in _DL_RE.findall(html or ""):
+        k = _clean(dt)
+        if k and k not in pairs: pairs[k] = _clean(dd)
+    salary = pairs.get("급여") or pairs.get("연봉") or ""
+    # "3,500만원" → "3500만원" (점수 계산의 \d{3,4} 매칭용)
+    salary = re.sub(r"(?<=\d),(?=\d)", "", salary)
+    m = re.search(r"(\d{4})\.(\d{2})\.(\d{2})\s*(\d{2}:\d{2})?", pairs.get("마감일", ""))
+    deadline = f"{m.group(1)}-{m.group(2)}-{m.group(3)}" + (f" {m.group(4)}" if m.group(4) else "") if m else ""
+    return {"salary": salary, "employment_type": pairs.get("근무형태", ""), "deadline_full": deadline}
+
+# ===== 보강기 =====
+class DetailEnricher:
+    # crawler: SaraminCrawler (세션, 속도 제한/재시도 경로 공유)
+    def __init__(self, crawler, cache_path=DETAIL_CACHE_PATH, workers=4, detail_url=DETAIL_URL, keep_days=120):
+        self.crawler = crawler
+        self.cache_path = cache_path
+        self.workers = workers
+        self.detail_url = detail_url
+        self.keep_days = keep_days
+        self._lock = threading.Lock()
+        self.cache = self._load()
+
+    def _load(self):
+        path = self.cache_path
+        if not os.path.exists(path) and path == DETAIL_CACHE_PATH: path = LEGACY_CACHE_PATH
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except Exception:
+            return {}
+
+    def save(self):
+        # 오래된 공고 항목은 정리
+        cutoff = (datetime.now() - timedelta(days=self.keep_days)).strftime("%Y-%m-%d %H:%M:%S")
+        self.cache = {k: v for k, v in self.cache.items() if v.get("fetched_at", "") >= cutoff}
+        os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+        tmp = self.cache_path + ".tmp"
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(self.cache, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp, self.cache_path)
+        if self.cache_path == DETAIL_CACHE_PATH and os.path.exists(LEGACY_CACHE_PATH): os.remove(LEGACY_CACHE_PATH)
+
+    def _fetch_one(self, rec_idx):
+        try:
+            d = parse_detail(self.crawler._request(self.detail_url, {"rec_idx": rec_idx}).text)
+        except Exception as e:
+            print(f"⚠️ 상세 페이지 실패 {rec_idx}: {e}")
+            return
+        d["fetched_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        with self._lock:
+            self.cache[rec_idx] = d
+
+    # 캐시에 없는 공고만 받아오고, DETAIL_FIELDS 를 채운 DataFrame 을 돌려줌 (빈 값은 기존 값 유지)
+    def enrich(self, df):
+        ids = [str(r) for r in df["rec_idx"]]
+        todo = list(dict.fromkeys(i for i in ids if i and i not in self.cache))
+        if todo and not self.crawler.replay:
+            with ThreadPoolExecutor(max_workers=self.workers) as ex:
+                list(ex.map(self._fetch_one, todo))
+            self.save()
+        print(f"✅ 상세 보강: 캐시 {len(ids) - len(todo)}건, 새로 받음 {len(todo)}건")
+
+        df = df.copy()
+        for col in DETAIL_FIELDS:
+            got = [self.cache.get(i, {}).get(col, "") for i in ids]
+            old = df[col].fillna("").astype(str).tolist() if col in df.columns else [""] * len(ids)
+            df[col] = [g or o for g, o in zip(got, old)]
+        return df
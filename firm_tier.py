@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+# 회사명 → 기업 규모 등급 ("big" | "mid" | "") 분류기 (test.py, send_kakao.py 공용)
+# 힌트 목록을 하나의 정규식(alternation)으로 미리 컴파일하고,
+# 같은 회사가 수백 건씩 반복되므로 정규화한 회사명 기준으로 결과를 메모이즈
+import re
+from functools import lru_cache
+
+BIG_FIRM_HINTS = ["대기업","공기업","공사","공단","그룹","삼성","LG","현대","롯데","한화","SK","카카오","네이버","KT","포스코"]
+MID_FIRM_HINTS = ["중견","강소","우량"]
+
+def _compile(hints, flags=0):
+    # 긴 힌트 먼저 → 겹치는 힌트가 있어도 결과(매치 여부)는 같고 백트래킹만 줄어듦
+    return re.compile("|".join(re.escape(h) for h in sorted(hints, key=len, reverse=True)), flags)
+
+_PATTERNS = {
+    False: (_compile(BIG_FIRM_HINTS), _compile(MID_FIRM_HINTS)),
+    True: (_compile(BIG_FIRM_HINTS, re.I), _compile(MID_FIRM_HINTS, re.I)),
+}
+
+@lru_cache(maxsize=65536)
+def _classify(key, ignore_case):
+    big, mid = _PATTERNS[ignore_case]
+    if big.search(key): return "big"
+    if mid.search(key): return "mid"
+    return ""
+
+# ignore_case=True 는 send_kakao 의 기존 동작(소문자 비교), 기본값은 test.py 의 기존 동작
+def firm_tier(name, ignore_case=False):
+    if not isinstance(name, str) or not name: return ""
+    key = name.strip()
+    return _classify(key.lower() if ignore_case else key, ignore_case)
@@ -0,0 +1,147 @@
+# -*- coding: utf-8 -*-
+# Gmail 지원완료 메일 조회
+#   - messages.list 를 nextPageToken 으로 끝까지 페이지네이션 (maxResults=10 제한 없음)
+#   - 본문 대신 Subject 헤더만 (format=metadata) 배치 HTTP 요청으로 한 번에 가져옴
+# service 는 googleapiclient 의 gmail v1 리소스 (테스트는 bench/fake_gmail.py)
+import os, re, json
+from datetime import datetime
+
+APPLIED_QUERY = '(subject:"입사지원 완료" OR subject:"지원이 완료되었습니다" OR subject:"성공적으로 완료되었습니다")'
+# 예시: [사람인] (주)애니아이티에 입사지원이 성공적으로 완료되었습니다.
+APPLIED_SUBJECT_RE = re.compile(r"\[사람인\]\s*(.+?)에\s*입사지원이\s*(?:성공적으로\s*)?완료")
+BATCH_SIZE = 50   # Gmail 배치 요청은 최대 100개, 50개 이하 권장
+
+def list_message_ids(service, query=APPLIED_QUERY, page_size=500):
+    ids, token = [], None
+    while True:
+        kw = {"userId": "me", "q": query, "maxResults": page_size}
+        if token: kw["pageToken"] = token
+        res = service.users().messages().list(**kw).execute()
+        ids += [m["id"] for m in res.get("messages", [])]
+        token = res.get("nextPageToken")
+        if not token: return ids
+
+def _subject(msg):
+    headers = (msg.get("payload") or {}).get("headers", [])
+    return next((h["value"] for h in headers if h["name"].lower() == "subject"), "")
+
+# internalDate(ms) → "YYYY-mm-dd HH:MM:SS" (없으면 "")
+def _received(msg):
+    ms = msg.get("internalDate")
+    return datetime.fromtimestamp(int(ms) / 1000).strftime("%Y-%m-%d %H:%M:%S") if ms else ""
+
+# {message_id: (subject, 받은 시각)} — 실패한 개별 요청은 빠짐
+def fetch_metadata(service, ids, batch_size=BATCH_SIZE):
+    meta = {}
+    def on_response(request_id, response, exception):
+        if exception is not None:
+            print(f"⚠️ 메일 {request_id} 조회 실패: {exception}"); return
+        meta[request_id] = (_subject(response), _received(response))
+
+    msgs = service.users().messages()
+    for i in range(0, len(ids), batch_size):
+        batch = service.new_batch_http_request(callback=on_response)
+        for mid in ids[i:i+batch_size]:
+            batch.add(msgs.get(userId="me", id=mid, format="metadata", metadataHeaders=["Subject"]), request_id=mid)
+        batch.execute()
+    return meta
+
+# {message_id: subject}
+def fetch_subjects(service, ids, batch_size=BATCH_SIZE):
+    return {mid: subject for mid, (subject, _) in fetch_metadata(service, ids, batch_size).items()}
+
+def parse_applied_company(subject):
+    m = APPLIED_SUBJECT_RE.search(subject or "")
+    return m.group(1).strip() if m else None
+
+# 지원완료 메일 → 회사명 목록 (메일 최신순)
+def applied_companies(service, query=APPLIED_QUERY):
+    ids = list_message_ids(service, query)
+    subjects = fetch_subjects(service, ids)
+    return [c for c in (parse_applied_company(subjects.get(i)) for i in ids) if c]
+
+
+# ===== historyId 체크포인트 기반 증분 동기화 =====
+# 체크포인트: {"history_id": 마지막으로 처리한 historyId, "handled": {메일 id: 회사명("" = 해당 없음)},
+#              "received": {지원완료 메일 id: 받은 시각}, "pending": [조회에 실패해 다음 실행에서 다시 볼 메일 id]}
+# historyId 는 조회 실패와 상관없이 넘어가므로, 실패한 메일은 pending 으로 남겨야 영영 빠지지 않음
+# 체크포인트가 있으면 history.list 로 그 이후 추가된 메일만, 없거나 너무 오래돼서(404) 거부되면 전체 검색
+# 메일 id·지원한 회사명이 들어 있으므로 공개되는 docs/ 가 아닌 상태 디렉터리에 둠 (워크플로는 actions/cache 로 유지)
+STATE_DIR = os.getenv("SARAMIN_STATE_DIR", ".state")
+CHECKPOINT_PATH = os.path.join(STATE_DIR, "gmail_checkpoint.json")
+LEGACY_CHECKPOINT_PATH = "docs/gmail_checkpoint.json"   # 예전 위치 — 한 번 옮기고 지움
+
+def load_checkpoint(path=None):
+    path = path or CHECKPOINT_PATH
+    if not os.path.exists(path) and os.path.exists(LEGACY_CHECKPOINT_PATH): path = LEGACY_CHECKPOINT_PATH
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            cp = json.load(f)
+        return {"history_id": cp.get("history_id"), "handled": dict(cp.get("handled", {})),
+                "received": dict(cp.get("received", {})), "pending": list(cp.get("pending", []))}
+    except Exception:
+        return {"history_id": None, "handled": {}, "received": {}, "pending": []}
+
+def save_checkpoint(cp, path=None):
+    path = path or CHECKPOINT_PATH
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(cp, f, ensure_ascii=False, indent=1)
+    os.replace(tmp, path)
+    if os.path.exists(LEGACY_CHECKPOINT_PATH) and os.path.abspath(path) != os.path.abspath(LEGACY_CHECKPOINT_PATH):
+        os.remove(LEGACY_CHECKPOINT_PATH)
+
+def _is_stale_history(e):
+    return getattr(getattr(e, "resp", None), "status", None) == 404
+
+# startHistoryId 이후 추가된 메일 id 와 현재 historyId
+def added_since(service, history_id):
+    ids, token, latest = [], None, history_id
+    while True:
+        kw = {"userId": "me", "startHistoryId": history_id, "historyTypes": ["messageAdded"], "maxResults": 500}
+        if token: kw["pageToken"] = token
+        res = service.users().history().list(**kw).execute()
+        for h in res.get("history", []):
+            ids += [a["message"]["id"] for a in h.get("messagesAdded", [])]
+        latest = res.get("historyId", latest)
+        token = res.get("nextPageToken")
+        if not token: return list(dict.fromkeys(ids)), latest
+
+# 지원완료 {회사명: 처음 지원완료 메일을 받은 시각} 전체 (이번에 새로 찾은 것 + 체크포인트에 쌓인 것)
+#   시각이 ""면 예전 체크포인트라 모름 → 호출 쪽에서 기존 값을 유지
+def sync_applied(service, path=None, query=APPLIED_QUERY):
+    cp = load_checkpoint(path)
+    handled, received = cp["handled"], cp["received"]
+    new_ids = None
+    if cp["history_id"]:
+        try:
+            ids, latest = added_since(service, cp["history_id"])
+            new_ids = [i for i in ids if i not in handled]
+            keep_misses = False   # history 에는 모든 새 메일이 섞여 있으므로 해당 없는 메일은 기록 안 함
+            print(f"✅ Gmail 증분 동기화: historyId {cp['history_id']} → {latest}, 새 메일 {len(new_ids)}건")
+        except Exception as e:
+            if not _is_stale_history(e): raise
+            print("⚠️ Gmail historyId 만료 → 전체 검색으로 전환")
+    if new_ids is None:
+        # 목록 조회 전에 historyId 를 잡아야 그 사이 도착한 메일을 다음 번에 놓치지 않음
+        latest = service.users().getProfile(userId="me").execute()["historyId"]
+        new_ids = [i for i in list_message_ids(service, query) if i not in handled]
+        keep_misses = True
+        print(f"✅ Gmail 전체 검색: 처리 안 된 메일 {len(new_ids)}건")
+
+    new_ids = list(dict.fromkeys([i for i in cp["pending"] if i not in handled] + new_ids))
+    meta = fetch_metadata(service, new_ids) if new_ids else {}
+    for mid, (subject, at) in meta.items():
+        company = parse_applied_company(subject)
+        if company or keep_misses: handled[mid] = company or ""
+        if company and at: received[mid] = at
+    pending = [i for i in new_ids if i not in meta]
+    if pending: print(f"⚠️ 메일 {len(pending)}건 조회 실패 → 다음 실행에서 다시 조회")
+    save_checkpoint({"history_id": str(latest), "handled": handled, "received": received, "pending": pending}, path)
+    out = {}
+    for mid, company in handled.items():
+        if not company: continue
+        at = received.get(mid, "")
+        if company not in out or (at and (not out[company] or at < out[company])): out[company] = at
+    return out
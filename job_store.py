@@ -0,0 +1,128 @@
+# -*- coding: utf-8 -*-
+# 공고 저장소 (SQLite)
+#   jobs     : rec_idx 기준 최신 공고 1행 (지원 상태 포함) — rec_idx/company/deadline 인덱스
+#   runs     : 수집 실행 기록
+#   job_runs : 실행별로 어떤 공고가 몇 점으로 잡혔는지 (히스토리)
+# CSV / HTML 은 current() 결과를 내보내는 파생 뷰
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+import pandas as pd
+
+DB_PATH = "saramin_jobs.db"
+# score 는 job_runs 에서 실행별로 가져오므로 항상 마지막
+JOB_COLS = ["rec_idx","title","company","location","career","education","deadline","link","salary","crawled_at",
+            "employment_type","deadline_full","profiles","score"]
+# crawl --enrich / --profiles 일 때만 채워지는 컬럼 — 값이 없는 실행이 덮어쓰지 않고, 비어 있으면 내보내지 않음
+OPTIONAL_COLS = ["employment_type","deadline_full","profiles"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    rec_idx TEXT PRIMARY KEY,
+    title TEXT, company TEXT, location TEXT, career TEXT, education TEXT,
+    deadline TEXT, link TEXT, salary TEXT, crawled_at TEXT,
+    employment_type TEXT, deadline_full TEXT, profiles TEXT, score INTEGER,
+    status TEXT DEFAULT '', applied_at TEXT DEFAULT '',
+    first_run INTEGER, last_run INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_company ON jobs(company);
+CREATE INDEX IF NOT EXISTS idx_jobs_deadline ON jobs(deadline);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT, rows INTEGER DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS job_runs (
+    run_id INTEGER, rec_idx TEXT, score INTEGER,
+    PRIMARY KEY (run_id, rec_idx)
+);
+CREATE INDEX IF NOT EXISTS idx_job_runs_rec ON job_runs(rec_idx);
+"""
+
+class JobStore:
+    def __init__(self, path=DB_PATH):
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self.path = str(path)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+        # 예전 스키마의 DB 에는 나중에 생긴 컬럼을 추가
+        have = {r[1] for r in self.conn.execute("PRAGMA table_info(jobs)")}
+        with self.conn:
+            for c in OPTIONAL_COLS:
+                if c not in have: self.conn.execute(f"ALTER TABLE jobs ADD COLUMN {c} TEXT")
+
+    def close(self):
+        self.conn.close()
+
+    def start_run(self):
+        with self.conn:
+            cur = self.conn.execute("INSERT INTO runs(started_at) VALUES (?)", (datetime.now().strftime("%Y-%m-%d %H:%M:%S"),))
+        return cur.lastrowid
+
+    def last_run(self):
+        row = self.conn.execute("SELECT MAX(run_id) FROM runs").fetchone()
+        return row[0]
+
+    # 실행 결과의 이름 — 변경분(delta)이 같은 결과를 두 번 계산하지 않도록 쓰는 키
+    def run_name(self, run_id):
+        return f"{Path(self.path).name}#run{run_id}"
+
+    # rec_idx 기준 upsert — 수집 필드만 갱신하고 status/applied_at 은 그대로 둠
+    def upsert(self, df, run_id):
+        rows = df.reindex(columns=JOB_COLS).astype(object)
+        rows = rows.where(rows.notna(), None)
+        rows["rec_idx"] = rows["rec_idx"].astype(str)
+        vals = [tuple(r) + (run_id, run_id) for r in rows.itertuples(index=False, name=None)]
+        cols = ",".join(JOB_COLS)
+        updates = ",".join(f"{c}=COALESCE(excluded.{c},{c})" if c in OPTIONAL_COLS else f"{c}=excluded.{c}"
+                           for c in JOB_COLS[1:])
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO jobs({cols},first_run,last_run) VALUES ({','.join('?'*(len(JOB_COLS)+2))}) "
+                f"ON CONFLICT(rec_idx) DO UPDATE SET {updates}, last_run=excluded.last_run", vals)
+            self.conn.executemany("INSERT OR REPLACE INTO job_runs(run_id, rec_idx, score) VALUES (?,?,?)",
+                                  [(run_id, r[0], r[JOB_COLS.index("score")]) for r in vals])
+            self.conn.execute("UPDATE runs SET rows=rows+? WHERE run_id=?", (len(vals), run_id))
+
+    # 지원 상태 갱신 — rec_idx 별 단일 행 UPDATE (인덱스 사용)
+    # applied_at: 한 값 또는 rec_ids 와 같은 순서의 값 목록 (메일 받은 시각)
+    def set_status(self, rec_ids, status="applied", applied_at=None):
+        rec_ids = [str(r) for r in rec_ids]
+        if applied_at is None or isinstance(applied_at, str):
+            applied_at = [applied_at or datetime.now().strftime("%Y-%m-%d %H:%M:%S")] * len(rec_ids)
+        with self.conn:
+            self.conn.executemany("UPDATE jobs SET status=?, applied_at=? WHERE rec_idx=?",
+                                  [(status, str(a), r) for r, a in zip(rec_ids, applied_at)])
+
+    def get(self, rec_idx):
+        cur = self.conn.execute("SELECT * FROM jobs WHERE rec_idx=?", (str(rec_idx),))
+        row = cur.fetchone()
+        return dict(zip([d[0] for d in cur.description], row)) if row else None
+
+    def by_company(self, company):
+        return pd.read_sql_query("SELECT * FROM jobs WHERE company=?", self.conn, params=(company,))
+
+    # 특정 실행(기본: 마지막 실행)에서 잡힌 공고를 그 실행 당시 점수순으로
+    def current(self, run_id=None):
+        run_id = run_id or self.last_run()
+        cols = ",".join(f"j.{c}" for c in JOB_COLS[:-1])
+        df = pd.read_sql_query(
+            f"SELECT {cols}, jr.score, j.status, j.applied_at FROM job_runs jr JOIN jobs j USING(rec_idx) "
+            "WHERE jr.run_id=? ORDER BY jr.score DESC", self.conn, params=(run_id,))
+        df = df.drop(columns=[c for c in OPTIONAL_COLS if df[c].isna().all()])
+        return df.fillna({"status": "", "applied_at": "", "salary": "", **{c: "" for c in OPTIONAL_COLS if c in df}})
+
+    def history(self, rec_idx):
+        return pd.read_sql_query(
+            "SELECT r.run_id, r.started_at, jr.score FROM job_runs jr JOIN runs r USING(run_id) "
+            "WHERE jr.rec_idx=? ORDER BY r.run_id", self.conn, params=(str(rec_idx),))
+
+    # ===== 파생 뷰 =====
+    def export_csv(self, path, run_id=None):
+        df = self.current(run_id)
+        df.to_csv(path, index=False, encoding="utf-8-sig")
+        return df
+
+    def export_html(self, crawler, path, run_id=None):
+        df = self.current(run_id)
+        crawler.build_html(df, path)
+        return df
@@ -0,0 +1,134 @@
+# -*- coding: utf-8 -*-
+# 실행 계측: 단계별 소요 시간, 카운터, 요청 지연 히스토그램, 최대 메모리 → JSON 실행 리포트
+#   with METRICS.stage("fetch"): ...      METRICS.count("pages")      METRICS.observe("request_ms", 120)
+#   METRICS.write("run_report.json")
+#   METRICS.write("run_report.json", merge=True)   # 단계를 따로 실행할 때: 기존 리포트에 이 실행의 단계를 덧붙임
+# SARAMIN_PROFILE=cprofile | tracemalloc 이면 실행 전체를 프로파일링해서 리포트 옆에 결과를 남김
+import os, sys, json, time, threading
+from contextlib import contextmanager
+from datetime import datetime
+
+PROFILE_MODE = os.getenv("SARAMIN_PROFILE", "").lower()
+HIST_BUCKETS_MS = [25, 50, 100, 200, 400, 800, 1600, 3200, 6400]
+
+def peak_rss_mb():
+    try:
+        import resource
+    except ImportError:   # Windows
+        return None
+    kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return round(kb / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+def _throughput(stages, counters):
+    rate = lambda n, stage: round(counters.get(n, 0) / stages[stage]["seconds"], 2) \
+        if stage in stages and stages[stage]["seconds"] > 0 else None
+    return {"pages_per_sec": rate("pages", "crawl"), "rows_per_sec": rate("rows", "crawl")}
+
+class RunMetrics:
+    def __init__(self, name="saramin"):
+        self.name = name
+        self.started = time.perf_counter()
+        self.started_at = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.stages, self.counters, self.samples = {}, {}, {}
+        self.lock = threading.Lock()
+        self._profiler = None
+
+    # 같은 이름의 단계가 여러 번(여러 스레드에서) 실행되면 시간/횟수를 합산
+    @contextmanager
+    def stage(self, name):
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add_time(name, time.perf_counter() - t0)
+
+    # 다른 프로세스 등에서 잰 시간을 단계에 더함
+    def add_time(self, name, seconds):
+        with self.lock:
+            s = self.stages.setdefault(name, {"seconds": 0.0, "calls": 0})
+            s["seconds"] += seconds; s["calls"] += 1
+
+    def count(self, name, n=1):
+        with self.lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def observe(self, name, value):
+        with self.lock:
+            self.samples.setdefault(name, []).append(value)
+
+    @staticmethod
+    def _histogram(values):
+        v = sorted(values)
+        pct = lambda p: round(v[min(len(v) - 1, int(p * len(v)))], 1)
+        buckets = {f"<={b}": sum(1 for x in v if x <= b) for b in HIST_BUCKETS_MS}
+        buckets["+inf"] = len(v)
+        return {"count": len(v), "min": round(v[0], 1), "p50": pct(0.5), "p90": pct(0.9), "p99": pct(0.99),
+                "max": round(v[-1], 1), "buckets": buckets}
+
+    def report(self):
+        with self.lock:
+            stages = {k: {"seconds": round(s["seconds"], 3), "calls": s["calls"]} for k, s in self.stages.items()}
+            counters = dict(self.counters)
+            hists = {k: self._histogram(v) for k, v in self.samples.items() if v}
+        wall = time.perf_counter() - self.started
+        return {
+            "name": self.name, "started_at": self.started_at, "wall_seconds": round(wall, 3),
+            "stages": stages, "counters": counters, "histograms": hists,
+            "throughput": _throughput(stages, counters),
+            "peak_rss_mb": peak_rss_mb(), "profile": PROFILE_MODE or None,
+        }
+
+    # 같은 이름의 단계/카운터/히스토그램은 이번 실행 값으로 교체 (단계를 다시 돌린 경우)
+    @staticmethod
+    def _merge(old, rep):
+        for k in ("stages", "counters", "histograms"):
+            rep[k] = {**old.get(k, {}), **rep[k]}
+        rep["name"], rep["started_at"] = old.get("name", rep["name"]), old.get("started_at", rep["started_at"])
+        rep["wall_seconds"] = round(old.get("wall_seconds", 0) + rep["wall_seconds"], 3)
+        rep["peak_rss_mb"] = max(filter(None, [old.get("peak_rss_mb"), rep["peak_rss_mb"]]), default=None)
+        rep["throughput"] = _throughput(rep["stages"], rep["counters"])
+        return rep
+
+    def write(self, path, merge=False):
+        rep = self.report()
+        if merge:
+            try:
+                with open(path, encoding="utf-8") as f: rep = self._merge(json.load(f), rep)
+            except (OSError, ValueError):
+                pass
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(rep, f, ensure_ascii=False, indent=1)
+        line = " · ".join(f"{k} {v['seconds']:.2f}s" for k, v in rep["stages"].items())
+        print(f"📊 실행 리포트 → {path} ({rep['wall_seconds']:.1f}s, RSS {rep['peak_rss_mb']}MB) {line}")
+        self.stop_profiling(path)
+        return rep
+
+    # ===== 선택: cProfile / tracemalloc =====
+    def start_profiling(self, mode=PROFILE_MODE):
+        if mode == "cprofile":
+            import cProfile
+            self._profiler = ("cprofile", cProfile.Profile()); self._profiler[1].enable()
+        elif mode == "tracemalloc":
+            import tracemalloc
+            tracemalloc.start(25); self._profiler = ("tracemalloc", None)
+
+    def stop_profiling(self, report_path):
+        if not self._profiler: return
+        kind, prof = self._profiler
+        self._profiler = None
+        base = os.path.splitext(report_path)[0]
+        if kind == "cprofile":
+            import pstats, io
+            prof.disable(); prof.dump_stats(base + ".prof")
+            out = io.StringIO(); pstats.Stats(prof, stream=out).sort_stats("cumulative").print_stats(40)
+            with open(base + ".cprofile.txt", "w", encoding="utf-8") as f: f.write(out.getvalue())
+            print(f"🔬 cProfile → {base}.prof, {base}.cprofile.txt")
+        else:
+            import tracemalloc
+            snap = tracemalloc.take_snapshot(); tracemalloc.stop()
+            with open(base + ".tracemalloc.txt", "w", encoding="utf-8") as f:
+                for st in snap.statistics("lineno")[:40]: f.write(f"{st}\n")
+            print(f"🔬 tracemalloc → {base}.tracemalloc.txt")
+
+METRICS = RunMetrics()
@@ -0,0 +1,154 @@
+# -*- coding: utf-8 -*-
+# 사람인 검색 결과 innerHTML → 공고(Job) 목록 파서 (엔진 교체 가능)
+#   bs4        : BeautifulSoup(html.parser) — 기준 구현
+#   lxml       : lxml.html + XPath
+#   selectolax : lexbor CSS 엔진 (설치돼 있을 때만)
+# 모든 엔진은 동일한 Job 을 순서대로 yield 해야 함 → bench/bench_parser.py 로 동등성 확인
+import time
+from datetime import datetime
+from typing import NamedTuple
+
+SARAMIN_BASE = "https://www.saramin.co.kr"
+
+# 공고 한 건 — dict 대신 튜플 (키 저장 없음), 필드 순서 = CSV 컬럼 순서
+# DataFrame(list_of_jobs) 로 바로 만들 수 있고, score_job 용으로 dict 처럼 get() 도 지원
+class Job(NamedTuple):
+    rec_idx: str
+    title: str
+    company: str
+    location: str
+    career: str
+    education: str
+    deadline: str
+    link: str
+    salary: str
+    crawled_at: str
+
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+JOB_FIELDS = list(Job._fields)
+
+def _now():
+    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+# crawled_at 은 페이지(파서 호출)마다 한 번만 잡아서 모든 공고가 같은 문자열을 공유
+def _job(rec_idx, title, href, company, info, deadline, crawled_at):
+    return Job(
+        rec_idx, title, company,
+        info[0] if len(info)>0 else "",
+        info[1] if len(info)>1 else "",
+        info[2] if len(info)>2 else "",
+        deadline,
+        SARAMIN_BASE + href if href.startswith("/") else href,
+        "",
+        crawled_at,
+    )
+
+# ===== BeautifulSoup =====
+def parse_bs4(html):
+    from bs4 import BeautifulSoup
+    ts = _now()
+    soup = BeautifulSoup(html, "html.parser")
+    for item in soup.select("div.item_recruit"):
+        try:
+            a = item.select_one("h2.job_tit a")
+            if not a: continue
+            corp_el = item.select_one("strong.corp_name a, strong.corp_name")
+            deadline_el = item.select_one("div.job_date span.date")
+            yield _job(
+                (item.get("value") or "").strip(),
+                a.get_text(strip=True),
+                a.get("href", ""),
+                corp_el.get_text(strip=True) if corp_el else "",
+                [s.get_text(strip=True) for s in item.select("div.job_condition span")[:3]],
+                deadline_el.get_text(strip=True) if deadline_el else "",
+                ts,
+            )
+        except Exception: continue
+
+# ===== lxml =====
+def _cls(name):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+_X_ITEM = f"//div[{_cls('item_recruit')}]"
+_X_TITLE = f".//h2[{_cls('job_tit')}]//a"
+_X_CORP = f".//strong[{_cls('corp_name')}]"
+_X_INFO = f".//div[{_cls('job_condition')}]//span"
+_X_DATE = f".//div[{_cls('job_date')}]//span[{_cls('date')}]"
+
+def _text(el):
+    # bs4 get_text(strip=True) 와 같은 규칙: 텍스트 노드마다 strip 후 이어붙임
+    return "".join(t.strip() for t in el.itertext())
+
+def parse_lxml(html):
+    import lxml.html
+    if not html or not html.strip(): return
+    ts = _now()
+    root = lxml.html.fromstring(html)
+    for item in root.xpath(_X_ITEM):
+        try:
+            a = item.xpath(_X_TITLE)
+            if not a: continue
+            a = a[0]
+            corp = item.xpath(_X_CORP)
+            date = item.xpath(_X_DATE)
+            yield _job(
+                (item.get("value") or "").strip(),
+                _text(a),
+                a.get("href", ""),
+                _text(corp[0]) if corp else "",
+                [_text(s) for s in item.xpath(_X_INFO)[:3]],
+                _text(date[0]) if date else "",
+                ts,
+            )
+        except Exception: continue
+
+# ===== selectolax =====
+def parse_selectolax(html):
+    from selectolax.lexbor import LexborHTMLParser
+    text = lambda el: el.text(deep=True, separator="", strip=True)
+    tree = LexborHTMLParser(html or "")
+    ts = _now()
+    for item in tree.css("div.item_recruit"):
+        try:
+            a = item.css_first("h2.job_tit a")
+            if not a: continue
+            corp = item.css_first("strong.corp_name")
+            date = item.css_first("div.job_date span.date")
+            yield _job(
+                (item.attributes.get("value") or "").strip(),
+                text(a),
+                a.attributes.get("href") or "",
+                text(corp) if corp else "",
+                [text(s) for s in item.css("div.job_condition span")[:3]],
+                text(date) if date else "",
+                ts,
+            )
+        except Exception: continue
+
+# 프로세스 풀 작업 단위: 한 페이지를 끝까지 파싱해서 (공고 목록, 걸린 초)
+# parser 는 위의 모듈 함수라 이름으로 pickle 되어 워커 프로세스로 넘어감
+def parse_page(parser, html):
+    t0 = time.perf_counter()
+    jobs = list(parser(html))
+    return jobs, time.perf_counter() - t0
+
+PARSERS = {"bs4": parse_bs4, "lxml": parse_lxml, "selectolax": parse_selectolax}
+_MODULES = {"bs4": "bs4", "lxml": "lxml.html", "selectolax": "selectolax.lexbor"}
+
+def available_parsers():
+    import importlib.util
+    out = []
+    for name, mod in _MODULES.items():
+        try:
+            if importlib.util.find_spec(mod): out.append(name)
+        except ModuleNotFoundError: pass
+    return out
+
+# "auto": 설치된 엔진 중 가장 빠른 것 (bench/bench_parser.py 측정 기준 순서)
+def get_parser(name="auto"):
+    if name == "auto":
+        avail = available_parsers()
+        name = next((n for n in ("selectolax", "lxml", "bs4") if n in avail), "bs4")
+    return PARSERS[name]
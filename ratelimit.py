@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+# 사람인 요청 공용 속도 제한 + 재시도
+#   AdaptiveLimiter : 토큰 버킷. 성공하면 속도를 조금씩 올리고(+step), 429/503 이면 절반으로 (AIMD)
+#   request()       : 제한기를 거쳐 요청, 429/5xx/연결 오류는 Retry-After 또는 지터 지수 백오프로 재시도,
+#                     요청 하나당 전체 마감 시간(deadline) 을 넘기면 RequestFailed
+#                     idempotent=False (메시지 전송 같은 POST): 서버가 처리했을 수 있는 응답 대기 타임아웃,
+#                     보낸 뒤 끊긴 연결, 5xx 는 재시도하지 않음 — 연결 수립 실패와 429/503 만 재시도
+import time, math, random, threading
+import requests
+from urllib3.exceptions import NewConnectionError
+
+RETRY_STATUS = {429, 500, 502, 503, 504}
+THROTTLE_STATUS = {429, 503}
+
+class RequestFailed(Exception):
+    pass
+
+class AdaptiveLimiter:
+    # rate: 초당 요청 수 (inf 면 제한 없음), burst: 쌓아둘 수 있는 최대 토큰
+    def __init__(self, rate=2.5, max_rate=None, min_rate=0.2, step=0.05, burst=1):
+        self.rate = rate
+        self.max_rate = max_rate or rate
+        self.min_rate = min(min_rate, rate)
+        self.step = step
+        self.burst = burst
+        self.tokens = burst
+        self.last = time.monotonic()
+        self.blocked_until = 0.0
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        if math.isinf(self.rate): return
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+            self.last = now
+            # 토큰이 모자라면 미리 예약(음수)하고 채워질 때까지 대기
+            wait = max(self.blocked_until - now, (1 - self.tokens) / self.rate, 0)
+            self.tokens -= 1
+        if wait > 0: time.sleep(wait)
+
+    def on_success(self):
+        if math.isinf(self.rate): return
+        with self.lock:
+            self.rate = min(self.max_rate, self.rate + self.step)
+
+    # 서버가 속도를 줄이라고 할 때: 속도 절반 + pause 초 동안 모든 요청 정지
+    def on_throttle(self, pause=0.0):
+        with self.lock:
+            if not math.isinf(self.rate):
+                self.rate = max(self.min_rate, self.rate / 2)
+            self.blocked_until = max(self.blocked_until, time.monotonic() + pause)
+
+def _retry_after(r):
+    v = (r.headers or {}).get("Retry-After")
+    if not v: return None
+    try:
+        return max(0.0, float(v))
+    except ValueError:
+        from email.utils import parsedate_to_datetime
+        try:
+            return max(0.0, parsedate_to_datetime(v).timestamp() - time.time())
+        except Exception:
+            return None
+
+# 연결 자체가 안 된 오류(ConnectTimeout, 이름 해석/접속 실패)만 요청이 나가지 않았다고 확신할 수 있음
+# RemoteDisconnected/ProtocolError 같은 ConnectionError 는 본문을 보낸 뒤에도 남
+def _never_sent(e):
+    if isinstance(e, requests.ConnectTimeout): return True
+    reason = e.args[0] if e.args else None
+    reason = getattr(reason, "reason", reason)   # 보통 MaxRetryError 로 감싸져 옴
+    return isinstance(reason, NewConnectionError)
+
+def request(session, method, url, limiter=None, retries=4, backoff=0.5, max_backoff=30.0,
+            deadline=60.0, timeout=20, idempotent=True, **kw):
+    retry_status = RETRY_STATUS if idempotent else THROTTLE_STATUS
+    end = time.monotonic() + deadline
+    last_err = None
+    for attempt in range(retries + 1):
+        if limiter: limiter.acquire()
+        remaining = end - time.monotonic()
+        if remaining <= 0: break
+        wait = None
+        try:
+            r = session.request(method, url, timeout=min(timeout, remaining), **kw)
+            if r.status_code not in retry_status:
+                # 403 차단 페이지 같은 4xx 는 성공이 아니므로 속도를 올리지 않음
+                if limiter and r.status_code < 400: limiter.on_success()
+                return r
+            last_err = f"HTTP {r.status_code}"
+            wait = _retry_after(r)
+            if limiter and r.status_code in THROTTLE_STATUS:
+                limiter.on_throttle(wait or 0.0)
+        except requests.ConnectionError as e:   # ConnectTimeout 포함
+            if not idempotent and not _never_sent(e):
+                raise RequestFailed(f"{method} {url} 연결 끊김 (재시도 안 함): {e!r}")
+            last_err = repr(e)
+        except requests.Timeout as e:
+            if not idempotent: raise RequestFailed(f"{method} {url} 응답 대기 시간 초과 (재시도 안 함): {e!r}")
+            last_err = repr(e)
+        if attempt == retries: break
+        # 지터 포함 지수 백오프 (Retry-After 가 있으면 그 값 우선)
+        if wait is None: wait = random.uniform(0, min(max_backoff, backoff * 2 ** attempt))
+        if time.monotonic() + wait >= end: break
+        time.sleep(wait)
+    raise RequestFailed(f"{method} {url} 실패 ({attempt+1}회 시도): {last_err}")
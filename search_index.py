@@ -0,0 +1,213 @@
+# -*- coding: utf-8 -*-
+# 공고 검색 색인: 제목 + 회사명 글자 bigram 역색인 + 지역/경력/마감일 필터
+#   형태소 분석 없이 "신입직원", "채용형인턴" 같은 붙여 쓴 한국어도 부분 일치로 찾음
+#   idx = SearchIndex.build(df)              # df 는 점수순 결과 → 문서 번호 = 순위
+#   idx.search("신입 개발", location="서울", career="신입", within_days=7, limit=20)
+#   idx.save("docs/search_index.json")       # 정적 검색 페이지(docs/search.html)와 CLI 가 같이 쓰는 파일
+#   python cli.py search "채용형인턴" --location 부산
+# 게시 목록(posting)은 문서 번호 오름차순 배열 → 가장 짧은 목록부터 조금씩 잘라 나머지와 교차(searchsorted),
+# 필터를 거쳐 limit 개가 차면 바로 멈춤 → 흔한 검색어도 전체 교집합을 만들지 않음
+import re, json
+from datetime import date, datetime
+from pathlib import Path
+import numpy as np
+from deadlines import deadline_date
+
+INDEX_PATH = "docs/search_index.json"
+PAGE_PATH = "docs/search.html"
+VIEW_URL = "https://www.saramin.co.kr/zf_user/jobs/relay/view?rec_idx="
+CHUNK = 256   # 처음 한 번에 확인할 후보 수
+_WORD = re.compile(r"\w+")
+_EMPTY = np.zeros(0, dtype=np.int32)
+
+def words(text):
+    return _WORD.findall(str(text).casefold()) if isinstance(text, str) else []
+
+# 검색어: 한 글자 단어는 unigram, 나머지는 연속 두 글자
+def grams(word):
+    return [word] if len(word) == 1 else [word[i:i+2] for i in range(len(word) - 1)]
+
+# 색인: 모든 글자 unigram + bigram (한 글자 검색어도 찾도록)
+def doc_grams(text_words):
+    return {g for w in text_words for g in (*w, *grams(w))}
+
+def _b36(n):
+    s = ""
+    while True:
+        n, r = divmod(n, 36)
+        s = "0123456789abcdefghijklmnopqrstuvwxyz"[r] + s
+        if not n: return s
+
+# 문서 번호 목록 → 간격을 36진수로 "a,1,3" (JSON 크기 절약)
+def encode_ids(ids):
+    return ",".join(_b36(int(g)) for g in np.diff(ids, prepend=0))
+
+def decode_ids(s):
+    return np.cumsum([int(x, 36) for x in s.split(",")], dtype=np.int64).astype(np.int32)
+
+class SearchIndex:
+    def __init__(self, docs, postings, facets):
+        self.docs = docs              # 컬럼별 리스트/배열 (rec_idx, title, company, deadline, score, location, career, deadline_day)
+        self.postings = postings      # gram → 문서 번호 배열
+        self.facets = facets          # {"location": [값...], "career": [값...]} — docs 의 코드가 가리킴
+        self.n = len(docs["rec_idx"])
+        self.text = [" ".join(words(t)) + " " + " ".join(words(c)) for t, c in zip(docs["title"], docs["company"])]
+
+    @classmethod
+    def build(cls, df):
+        now = datetime.now()
+        col = lambda c: df[c].astype(object).where(df[c].notna(), "").astype(str).tolist() if c in df.columns else [""] * len(df)
+        docs = {c: col(c) for c in ["rec_idx", "title", "company", "deadline"]}
+        docs["score"] = np.asarray(df["score"] if "score" in df.columns else np.zeros(len(df)), dtype=np.int32)
+        facets = {}
+        for c in ["location", "career"]:
+            uniq, codes = np.unique(np.asarray(col(c), dtype=object), return_inverse=True)
+            facets[c] = [str(u) for u in uniq]
+            docs[c] = codes.astype(np.int32)
+        docs["deadline_day"] = np.array([d.toordinal() if d else -1 for d in (deadline_date(t, now) for t in docs["deadline"])],
+                                        dtype=np.int32)
+        lists, memo = {}, {}   # 같은 회사명/제목이 반복되므로 문자열별 gram 집합을 재사용
+        text_grams = lambda s: memo.get(s) or memo.setdefault(s, doc_grams(words(s)))
+        for i, (t, c) in enumerate(zip(docs["title"], docs["company"])):
+            for g in text_grams(t) | text_grams(c):
+                lists.setdefault(g, []).append(i)
+        postings = {g: np.asarray(ids, dtype=np.int32) for g, ids in lists.items()}
+        return cls(docs, postings, facets)
+
+    # ===== 검색 =====
+    def _allowed(self, field, value):
+        if not value: return None
+        return np.array([value in v for v in self.facets[field]], dtype=bool)
+
+    def search(self, query="", location=None, career=None, within_days=None, limit=20):
+        terms = words(query)
+        gs = {g for w in terms for g in grams(w)}
+        if gs:
+            lists = [self.postings.get(g, _EMPTY) for g in gs]
+            lists.sort(key=len)
+            base, rest = lists[0], lists[1:]
+        else:
+            base, rest = np.arange(self.n, dtype=np.int32), []
+        loc_ok, car_ok = self._allowed("location", location), self._allowed("career", career)
+        if within_days is not None:
+            today = date.today().toordinal()
+            dd = self.docs["deadline_day"]
+        out, found, start, step = [], 0, 0, CHUNK
+        while start < len(base) and found < limit:
+            # 필터가 좁으면 한 묶음에서 몇 건 안 남으므로 묶음 크기를 두 배씩 늘림
+            c = base[start:start + step]
+            start += step; step *= 2
+            for l in rest:
+                pos = np.minimum(np.searchsorted(l, c), len(l) - 1)
+                c = c[l[pos] == c]
+                if not len(c): break
+            if loc_ok is not None: c = c[loc_ok[self.docs["location"][c]]]
+            if car_ok is not None: c = c[car_ok[self.docs["career"][c]]]
+            if within_days is not None: c = c[(dd[c] >= today) & (dd[c] <= today + within_days)]
+            # bigram 이 모두 있어도 이어져 있지 않을 수 있으므로 원문에 단어가 있는지 확인
+            if terms: c = [i for i in c.tolist() if all(w in self.text[i] for w in terms)]
+            out.extend(c); found += len(c)
+        return [self.doc(i) for i in out[:limit]]
+
+    def doc(self, i):
+        d = self.docs
+        return {"rec_idx": d["rec_idx"][i], "title": d["title"][i], "company": d["company"][i],
+                "location": self.facets["location"][d["location"][i]], "career": self.facets["career"][d["career"][i]],
+                "deadline": d["deadline"][i], "score": int(d["score"][i]), "link": VIEW_URL + d["rec_idx"][i]}
+
+    # ===== 저장 (정적 페이지와 같은 형식) =====
+    def to_json(self):
+        d = self.docs
+        return {
+            "v": 1, "built_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"), "view_url": VIEW_URL,
+            "facets": self.facets,
+            "docs": {"rec_idx": d["rec_idx"], "title": d["title"], "company": d["company"], "deadline": d["deadline"],
+                     "score": d["score"].tolist(), "location": d["location"].tolist(), "career": d["career"].tolist(),
+                     "deadline_day": d["deadline_day"].tolist()},
+            "grams": {g: encode_ids(ids) for g, ids in self.postings.items()},
+        }
+
+    def save(self, path=INDEX_PATH):
+        p = Path(path); p.parent.mkdir(parents=True, exist_ok=True)
+        tmp = p.with_suffix(".tmp")
+        tmp.write_text(json.dumps(self.to_json(), ensure_ascii=False, separators=(",", ":")), encoding="utf-8")
+        tmp.replace(p)
+        return p
+
+    @classmethod
+    def load(cls, path=INDEX_PATH):
+        js = json.loads(Path(path).read_text(encoding="utf-8"))
+        d = js["docs"]
+        docs = {"rec_idx": d["rec_idx"], "title": d["title"], "company": d["company"], "deadline": d["deadline"],
+                **{c: np.asarray(d[c], dtype=np.int32) for c in ["score", "location", "career", "deadline_day"]}}
+        return cls(docs, {g: decode_ids(s) for g, s in js["grams"].items()}, js["facets"])
+
+# ===== 정적 검색 페이지 (docs/search.html) =====
+# search_index.json 을 한 번 받아 같은 방식(bigram 교집합 → 원문 확인 → 필터)으로 찾고 상위 결과만 카드로 그림
+SEARCH_PAGE = """<html><head><meta charset="UTF-8">
+<meta name="viewport" content="width=device-width,initial-scale=1"><title>채용공고 검색</title>
+<style>
+body{font-family:"Pretendard","Apple SD Gothic Neo",sans-serif;background:#f9fafb;margin:0;}
+h2{text-align:center;color:#2563eb;padding:20px 0 8px;}
+.bar{max-width:600px;margin:0 auto;display:flex;flex-wrap:wrap;gap:6px;padding:0 12px;}
+.bar input,.bar select{padding:8px;border:1px solid #ddd;border-radius:6px;font-size:14px;}
+.bar input[type=search]{flex:1 1 100%;}
+#info{max-width:600px;margin:8px auto;color:#555;font-size:13px;padding:0 12px;}
+.card{background:white;margin:12px auto;padding:16px 20px;max-width:600px;border-radius:10px;box-shadow:0 2px 6px rgba(0,0,0,0.05);}
+.title{font-weight:600;color:#1d4ed8;}.company{margin-top:4px;}.meta{font-size:13px;color:#555;margin-top:6px;}
+.button{display:inline-block;margin-top:10px;padding:8px 14px;background:#2563eb;color:#fff;border-radius:6px;text-decoration:none;}
+</style></head><body>
+<h2>🔎 채용공고 검색</h2>
+<div class="bar"><input type="search" id="q" placeholder="예: 신입직원, 채용형인턴, 회사명" autofocus>
+<select id="loc"><option value="">지역 전체</option></select><select id="car"><option value="">경력 전체</option></select>
+<select id="days"><option value="">마감 전체</option><option value="3">3일 이내</option><option value="7">7일 이내</option><option value="30">30일 이내</option></select></div>
+<div id="info">색인 불러오는 중…</div><div id="out"></div>
+<script>
+const LIMIT = 50;
+let IX = null, TEXT = null, POST = {};
+const words = s => (s.toLowerCase().match(/[\\p{L}\\p{N}_]+/gu) || []);
+const grams = w => w.length === 1 ? [w] : Array.from({length: w.length - 1}, (_, i) => w.slice(i, i + 2));
+const ids = g => {
+  if (!(g in POST)) { let s = IX.grams[g], a = [], v = 0; if (s) for (const x of s.split(",")) a.push(v += parseInt(x, 36)); POST[g] = a; }
+  return POST[g];
+};
+const esc = s => String(s).replace(/[&<>"']/g, c => ({"&":"&amp;","<":"&lt;",">":"&gt;",'"':"&quot;","'":"&#39;"}[c]));
+function search() {
+  const terms = words(q.value), D = IX.docs;
+  const gs = [...new Set(terms.flatMap(grams))];
+  let lists = gs.map(ids).sort((a, b) => a.length - b.length);
+  const base = lists.length ? lists[0] : D.rec_idx.map((_, i) => i), rest = lists.slice(1).map(l => new Set(l));
+  const loc = loc_.value, car = car_.value, days = days_.value === "" ? null : +days_.value;
+  const today = Math.floor((Date.now() - new Date().getTimezoneOffset() * 6e4) / 864e5) + 719163;   // 파이썬 date.toordinal()
+  const out = [];
+  for (const i of base) {
+    if (!rest.every(s => s.has(i))) continue;
+    if (loc && !IX.facets.location[D.location[i]].includes(loc)) continue;
+    if (car && !IX.facets.career[D.career[i]].includes(car)) continue;
+    if (days !== null && !(D.deadline_day[i] >= today && D.deadline_day[i] <= today + days)) continue;
+    if (!terms.every(w => TEXT[i].includes(w))) continue;
+    out.push(i); if (out.length >= LIMIT) break;
+  }
+  info.textContent = `${D.rec_idx.length}건 중 상위 ${out.length}건 (색인 ${IX.built_at})`;
+  $("out").innerHTML = out.map(i => `<div class="card"><div class="title">${esc(D.title[i])}</div>
+    <div class="company">${esc(D.company[i])}</div><div class="meta">${esc(IX.facets.location[D.location[i]])} · ${esc(IX.facets.career[D.career[i]])} · 마감일: ${esc(D.deadline[i])} · 점수: ${D.score[i]}</div>
+    <a href="${IX.view_url}${esc(D.rec_idx[i])}" class="button" target="_blank">🔗 공고 바로가기</a></div>`).join("");
+}
+const $ = id => document.getElementById(id);
+const q = $("q"), info = $("info"), loc_ = $("loc"), car_ = $("car"), days_ = $("days");
+fetch("search_index.json").then(r => r.json()).then(js => {
+  IX = js; TEXT = js.docs.title.map((t, i) => words(t).join(" ") + " " + words(js.docs.company[i]).join(" "));
+  const opts = (sel, vals) => vals.filter(v => v).forEach(v => sel.add(new Option(v, v)));
+  opts(loc_, [...new Set(js.facets.location.map(v => v.slice(0, 2)))]); opts(car_, js.facets.career);
+  for (const el of [q, loc_, car_, days_]) el.addEventListener("input", search);
+  search();
+});
+</script></body></html>"""
+
+# 색인 파일 + 검색 페이지를 docs/ 에 함께 씀
+def publish(df, path=INDEX_PATH, page_path=PAGE_PATH):
+    idx = SearchIndex.build(df)
+    p = idx.save(path)
+    Path(page_path).write_text(SEARCH_PAGE, encoding="utf-8")
+    print(f"✅ 검색 색인 → {p} ({idx.n}건, {len(idx.postings)} grams, {p.stat().st_size // 1024}KB) + {page_path}")
+    return idx
@@ -1,7 +1,10 @@
 # -*- coding: utf-8 -*-
-import os, re, json, requests
-from bs4 import BeautifulSoup
+import os, re, sys, json, time, requests
 from datetime import datetime, timedelta, timezone
+from firm_tier import firm_tier
+from metrics import RunMetrics
+import ratelimit
+import delta
 
 # ===== 기본 설정 =====
 KST = timezone(timedelta(hours=9))
@@ -9,8 +12,16 @@ REST_API_KEY = os.getenv("KAKAO_REST_API_KEY")
 REFRESH_TOKEN = os.getenv("KAKAO_REFRESH_TOKEN")
 PAGES_URL = os.getenv("PAGES_URL", "https://pkpjs.github.io/test/saramin_results_latest.html")
 HTML_PATH = "docs/saramin_results_latest.html"
-STATE_PATH = "docs/last_rec_ids.json"
+FEED_PATH = "docs/saramin_results_latest.jsonl"
+DELTA_PATH = delta.DELTA_PATH   # 크롤러가 남긴 실행 간 변경분 — 신규 공고 판단 기준
 SARAMIN_BASE = "https://www.saramin.co.kr"
+REPORT_PATH = "kakao_run_report.json"
+METRICS = RunMetrics("kakao")
+# 토큰은 공개되는 docs/ 가 아니라 사용자 캐시 디렉터리에 (권한 0600)
+TOKEN_CACHE_PATH = os.getenv("KAKAO_TOKEN_CACHE", os.path.expanduser("~/.cache/saramin/kakao_token.json"))
+TOKEN_MARGIN = 300      # 만료 5분 전이면 미리 갱신
+TOKEN_URL = "https://kauth.kakao.com/oauth/token"
+MEMO_URL = "https://kapi.kakao.com/v2/api/talk/memo/default/send"
 
 # ===== 점수 가중치 =====
 DEADLINE_IMMINENT_3D = 50
@@ -22,19 +33,51 @@ FIRM_BIG = 15
 FIRM_MID = 10
 SALARY_GOOD = 5
 
-BIG_FIRM_HINTS = ["대기업","공기업","공사","공단","그룹","삼성","LG","현대","롯데","한화","SK","카카오","네이버","KT","포스코"]
-MID_FIRM_HINTS = ["중견","강소","우량"]
+# ===== Kakao 토큰 (만료 전까지 캐시) =====
+# 토큰 갱신과 메시지 전송이 같은 keep-alive 연결을 씀
+def make_session():
+    return requests.Session()
 
-# ===== Kakao 토큰 갱신 =====
-def refresh_access_token() -> str:
-    url = "https://kauth.kakao.com/oauth/token"
-    data = {"grant_type": "refresh_token", "client_id": REST_API_KEY, "refresh_token": REFRESH_TOKEN}
-    r = requests.post(url, data=data, timeout=20)
-    r.raise_for_status()
+def load_token_cache(path=None):
+    try:
+        with open(path or TOKEN_CACHE_PATH, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_token_cache(cache, path=None):
+    path = path or TOKEN_CACHE_PATH
+    try:
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        tmp = path + ".tmp"
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(cache, f)
+        os.replace(tmp, path)
+    except OSError as e:
+        print(f"⚠️ 토큰 캐시 저장 실패: {e}")
+
+def refresh_access_token(session=None, refresh_token=None) -> dict:
+    data = {"grant_type": "refresh_token", "client_id": REST_API_KEY, "refresh_token": refresh_token or REFRESH_TOKEN}
+    r = ratelimit.request(session or requests, "POST", TOKEN_URL, data=data, retries=2, deadline=30)
     js = r.json()
     if "access_token" not in js:
         raise RuntimeError(f"토큰 갱신 실패: {js}")
-    return js["access_token"]
+    return js
+
+# 캐시된 토큰이 유효하면 네트워크 없이 그대로, 아니면 갱신해서 캐시
+# (카카오는 리프레시 토큰 만료가 가까우면 새 refresh_token 도 함께 주므로 같이 보관)
+def get_access_token(session=None, force=False, path=None) -> str:
+    cache = load_token_cache(path)
+    if not force and cache.get("access_token") and cache.get("expires_at", 0) - TOKEN_MARGIN > time.time():
+        METRICS.count("token_cache_hit")
+        return cache["access_token"]
+    js = refresh_access_token(session, cache.get("refresh_token"))
+    METRICS.count("token_refresh")
+    cache = {"access_token": js["access_token"], "expires_at": time.time() + int(js.get("expires_in", 0)),
+             "refresh_token": js.get("refresh_token") or cache.get("refresh_token")}
+    save_token_cache(cache, path)
+    return cache["access_token"]
 
 # ===== HTML 로드 및 정제 =====
 def load_html_text() -> str:
@@ -64,9 +107,12 @@ def parse_deadline(text: str):
     month, day = int(m.group(1)), int(m.group(2))
     now = datetime.now(KST)
     year = now.year
-    d = datetime(year, month, day, tzinfo=KST)
-    if d < now - timedelta(days=180):
-        d = datetime(year+1, month, day, tzinfo=KST)
+    try:
+        d = datetime(year, month, day, tzinfo=KST)
+        if d < now - timedelta(days=180):
+            d = datetime(year+1, month, day, tzinfo=KST)
+    except ValueError:   # 02/30 같은 잘못된 날짜
+        return None
     return d
 
 def days_to_deadline(d):
@@ -89,8 +135,43 @@ def format_deadline_display(deadline_dt, raw_text: str) -> str:
         return f"마감 {mmdd}"
     return t or ""
 
-# ===== 공고 추출 (카드 + 테이블 둘 다 지원) =====
+# ===== 크롤러 JSON 피드 (점수/마감일 그대로 사용) =====
+# 피드 점수의 신선도 항은 render 때 같은 변경분(delta_latest.json)으로 매겨짐 (cli._rescored)
+def load_feed(path=FEED_PATH):
+    try:
+        f = open(path, "r", encoding="utf-8")
+    except FileNotFoundError:
+        return None
+    items = []
+    with f:
+        for line in f:
+            if not line.strip(): continue
+            r = json.loads(line)
+            dd = r.get("deadline_date")
+            deadline_dt = datetime.fromisoformat(dd).replace(tzinfo=KST) if dd else None
+            raw = r.get("deadline", "")
+            items.append({
+                "title": r.get("title", ""),
+                "company": r.get("company", ""),
+                "location": " · ".join(x for x in [r.get("location", ""), r.get("career", "")] if x),
+                "job": "(직무정보없음)",
+                "deadline_text": raw,
+                "deadline": deadline_dt,
+                "deadline_disp": format_deadline_display(deadline_dt, raw),
+                "salary": r.get("salary", ""),
+                "url": r.get("link", ""),
+                "rec_idx": r.get("rec_idx") or None,
+                "score": r.get("score"),
+            })
+    return items
+
+# ===== 공고 추출 (JSON 피드 우선, 없으면 카드 + 테이블 HTML) =====
 def extract_items():
+    items = load_feed(FEED_PATH)
+    if items is not None:
+        return items, len(items)
+
+    from bs4 import BeautifulSoup   # 피드가 없을 때만 필요
     html = load_html_text()
     soup = BeautifulSoup(html, "lxml")
 
@@ -114,7 +195,7 @@ def extract_items():
 
             # 점수
             m_score = re.search(r"(\d+)", score_text)
-            score_val = int(m_score.group(1)) if m_score else 0
+            score_val = int(m_score.group(1)) if m_score else None
 
             # rec_idx
             m_idx = re.search(r"rec_idx=(\d+)", url)
@@ -191,22 +272,10 @@ def extract_items():
         })
     return items, total
 
-# ===== rec_idx 관리 =====
-def load_last_rec_ids():
-    try:
-        with open(STATE_PATH, "r", encoding="utf-8") as f:
-            return set(json.load(f))
-    except Exception:
-        return set()
-
-def save_current_rec_ids(items):
-    recs = [x["rec_idx"] for x in items if x.get("rec_idx")]
-    try:
-        os.makedirs(os.path.dirname(STATE_PATH), exist_ok=True)
-        with open(STATE_PATH, "w", encoding="utf-8") as f:
-            json.dump(recs, f, ensure_ascii=False, indent=2)
-    except Exception:
-        pass
+# ===== 신규 공고 (delta.py 변경분) =====
+# 변경분이 없으면 None → 모두 신규로 봄 (처음 실행과 같음)
+def load_delta():
+    return delta.load_delta(DELTA_PATH)
 
 # ===== 점수 계산 =====
 def deadline_score(deadline):
@@ -216,14 +285,14 @@ def deadline_score(deadline):
     if d <= 7:    return DEADLINE_IMMINENT_7D
     return max(0, 30 - min(d, 30))
 
-def freshness_score(item, last_ids: set):
-    rec = item.get("rec_idx")
-    return FRESH_NEW if rec and rec not in last_ids else FRESH_OLD
+def freshness_score(item, fresh_ids):
+    if fresh_ids is None: return FRESH_NEW
+    return FRESH_NEW if item.get("rec_idx") in fresh_ids else FRESH_OLD
 
 def firm_score(name: str):
-    n = (name or "").lower()
-    if any(k.lower() in n for k in BIG_FIRM_HINTS): return FIRM_BIG
-    if any(k.lower() in n for k in MID_FIRM_HINTS): return FIRM_MID
+    tier = firm_tier(name, ignore_case=True)
+    if tier == "big": return FIRM_BIG
+    if tier == "mid": return FIRM_MID
     return 0
 
 def salary_score(text: str):
@@ -234,70 +303,111 @@ def salary_score(text: str):
         return SALARY_GOOD
     return 0
 
-def score_item(item, last_ids: set):
+def score_item(item, fresh_ids):
     return (
         deadline_score(item["deadline"]) +
-        freshness_score(item, last_ids) +
+        freshness_score(item, fresh_ids) +
         firm_score(item["company"]) +
         salary_score(item["salary"])
     )
 
-def rank_top(items, k=5):
-    last_ids = load_last_rec_ids()
+def rank_top(items, k=5, d=None):
+    fresh_ids = delta.fresh_ids(d if d is not None else load_delta())
     for it in items:
-        if "score" not in it or not it["score"]:
-            it["score"] = score_item(it, last_ids)
+        if it.get("score") is None:
+            it["score"] = score_item(it, fresh_ids)
     items.sort(key=lambda x: x["score"], reverse=True)
-    topk = items[:k]
-    save_current_rec_ids(items)
-    return topk
+    return items[:k]
 
 # ===== 카카오톡 전송 =====
-def send_text(access_token: str, text: str):
-    url = "https://kapi.kakao.com/v2/api/talk/memo/default/send"
-    headers = {"Authorization": f"Bearer {access_token}"}
-    chunks = []
-    buf = []
-    cur_len = 0
+def split_chunks(text, limit=1000):
+    chunks, buf, cur_len = [], [], 0
     for line in text.splitlines():
         add = len(line) + 1
-        if cur_len + add > 1000:
+        if cur_len + add > limit:
             chunks.append("\n".join(buf))
             buf, cur_len = [], 0
         buf.append(line)
         cur_len += add
     if buf:
         chunks.append("\n".join(buf))
-
-    for i, chunk in enumerate(chunks, start=1):
-        suffix = f"\n\n(#{i}/{len(chunks)})" if len(chunks) > 1 else ""
-        template_object = {
-            "object_type": "text",
-            "text": chunk + suffix,
-            "link": {"web_url": PAGES_URL, "mobile_web_url": PAGES_URL},
-            "button_title": "전체 공고 보기"
-        }
-        data = {"template_object": json.dumps(template_object, ensure_ascii=False)}
-        r = requests.post(url, headers=headers, data=data, timeout=20)
+    return chunks
+
+def send_chunk(session, token, text):
+    template_object = {
+        "object_type": "text",
+        "text": text,
+        "link": {"web_url": PAGES_URL, "mobile_web_url": PAGES_URL},
+        "button_title": "전체 공고 보기"
+    }
+    data = {"template_object": json.dumps(template_object, ensure_ascii=False)}
+    t0 = time.perf_counter()
+    # 메시지 전송은 멱등이 아님 — 응답 대기 중 타임아웃이면 이미 보내졌을 수 있으므로 재시도하지 않음
+    r = ratelimit.request(session, "POST", MEMO_URL, headers={"Authorization": f"Bearer {token}"},
+                          data=data, retries=3, deadline=60, idempotent=False)
+    METRICS.observe("request_ms", (time.perf_counter() - t0) * 1000)
+    return r
+
+# 조각들을 하나의 keep-alive 세션으로 순서대로 보냄 (채팅방에 도착하는 순서 = 조각 순서)
+# 401 이면 토큰을 한 번 강제 갱신 후 재전송, 실패하면 뒤 조각은 보내지 않고 예외
+def send_text(access_token: str, text: str, session=None):
+    session = session or make_session()
+    chunks = split_chunks(text)
+    n = len(chunks)
+    token = access_token
+    for i, c in enumerate(chunks, start=1):
+        body = c + (f"\n\n(#{i}/{n})" if n > 1 else "")
         try:
-            print("전송 결과:", r.json())
-        except Exception:
-            print("전송 결과:", r.text)
+            r = send_chunk(session, token, body)
+            if r.status_code == 401:
+                token = get_access_token(session, force=True)
+                r = send_chunk(session, token, body)
+        except ratelimit.RequestFailed as e:
+            r = e
+        ok = isinstance(r, requests.Response) and r.ok
+        METRICS.count("messages_sent" if ok else "messages_failed")
+        try:
+            print(f"전송 결과 #{i}:", r.json() if isinstance(r, requests.Response) else r)
+        except ValueError:
+            print(f"전송 결과 #{i}:", r.text)
+        if not ok:
+            raise RuntimeError(f"카카오톡 전송 실패: 조각 {i} / {n}")
 
 # ===== 메인 =====
-def main():
-    access_token = refresh_access_token()
-    items_all, total = extract_items()
+# delta_only: 변경분(신규 + 변경) 공고만 대상으로, 없으면 보내지 않음
+def main(delta_only=False):
+    METRICS.start_profiling()
+    try:
+        run(delta_only)
+    finally:
+        METRICS.write(REPORT_PATH)
+
+def run(delta_only=False):
+    with METRICS.stage("load_items"):
+        items_all, total = extract_items()
+        d = load_delta()
+        if delta_only and d is not None:
+            ids = {it["rec_idx"] for it in d["added"] + d["changed"]}
+            items_all = [it for it in items_all if it.get("rec_idx") in ids]
+    METRICS.count("items", len(items_all))
     if not items_all:
-        print("❌ 데이터 없음")
+        print("📭 변경분 없음" if delta_only else "❌ 데이터 없음")
         return
 
-    top5 = rank_top(items_all, k=5)
+    session = make_session()
+    with METRICS.stage("token"):
+        access_token = get_access_token(session)
+    with METRICS.stage("rank"):
+        top5 = rank_top(items_all, k=5, d=d)
 
     today = datetime.now(KST).strftime("%Y-%m-%d")
     lines = []
     lines.append(f"📅 {today} 기준 AI 추천 TOP 5 채용공고")
-    lines.append(f"총 {total}개 중 선별된 상위 공고입니다.\n")
+    lines.append(f"총 {total}개 중 선별된 상위 공고입니다.")
+    if d is not None and not d.get("baseline"):
+        c = d["counts"]
+        lines.append(f"🆕 신규 {c['added']} · 변경 {c['changed']} · 마감/삭제 {c['removed']}")
+    lines.append("")
 
     for i, it in enumerate(top5, start=1):
         title_line = f"{i}위 ({it['score']}점) | {it['company']} | {it['location']} | {it['deadline_disp']}"
@@ -307,8 +417,9 @@ def main():
 
     lines.append(f"👇 전체 공고 보기:\n{PAGES_URL}")
     final_message = "\n".join(lines)
-    send_text(access_token, final_message)
+    with METRICS.stage("send"):
+        send_text(access_token, final_message, session)
     print(f"✅ 전송 완료: {len(top5)}개 항목")
 
 if __name__ == "__main__":
-    main()
+    main("--delta" in sys.argv[1:])
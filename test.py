@@ -1,23 +1,56 @@
 # -*- coding: utf-8 -*-
-import math, time, os, re, csv, json, requests, smtplib
+import math, time, os, re, csv, json, sys, requests, threading, hashlib, heapq
+import numpy as np
 import pandas as pd
-from bs4 import BeautifulSoup
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from contextlib import nullcontext, contextmanager
+import multiprocessing
 from datetime import datetime
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
 from pathlib import Path
-from google.oauth2.credentials import Credentials
-from googleapiclient.discovery import build
+from html import escape as html_escape
+from parsers import get_parser, parse_page, JOB_FIELDS
+from firm_tier import firm_tier
+from deadlines import deadline_date
+import gmail_sync
+from company_index import CompanyIndex
+import ratelimit
+from metrics import METRICS
+from ratelimit import AdaptiveLimiter
 
 # ================== AI 가중치 ==================
-BIG_FIRM_HINTS = ["대기업","공기업","공사","공단","그룹","삼성","LG","현대","롯데","한화","SK","카카오","네이버","KT","포스코"]
-MID_FIRM_HINTS = ["중견","강소","우량"]
 DEADLINE_IMMINENT_3D, DEADLINE_IMMINENT_7D, DEADLINE_NONE = 50, 40, 10
 FRESH_NEW, FRESH_OLD = 30, -10
 FIRM_BIG, FIRM_MID = 15, 10
 SALARY_GOOD = 5
+# 값 종류가 적은 컬럼은 category (문자열은 한 번만 저장, 행마다 정수 코드)
+CATEGORY_COLS = ["company","location","career","education"]
 
-def score_job(j):
+def compact_frame(df):
+    for c in CATEGORY_COLS:
+        if c not in df.columns: continue
+        s = df[c] if isinstance(df[c].dtype, pd.CategoricalDtype) else df[c].astype("category")
+        if s.isna().any():
+            # HTML/피드의 fillna("") 가 새 카테고리 오류를 내지 않도록 빈 문자열로 채워둠
+            if "" not in s.cat.categories: s = s.cat.add_categories("")
+            s = s.fillna("")
+        df[c] = s
+    return df
+
+# 새 공고(Job 목록)를 이전 결과 앞에 붙이고 rec_idx 중복 제거, keep_days 보다 오래된 공고 정리 후 점수순
+def merge_new(prev_df, new_jobs, keep_days=60):
+    new_df = pd.DataFrame(new_jobs, columns=JOB_FIELDS)
+    df = pd.concat([new_df, prev_df], ignore_index=True) if prev_df is not None else new_df
+    if df.empty: return df
+    df.drop_duplicates(subset=["rec_idx"], keep="first", inplace=True)
+    cutoff = (datetime.now() - pd.Timedelta(days=keep_days)).strftime("%Y-%m-%d %H:%M:%S")
+    df = compact_frame(df[df["crawled_at"].fillna("").astype(str) >= cutoff].copy())
+    df["score"] = score_frame(df)
+    return df.sort_values("score",ascending=False).reset_index(drop=True)
+
+def score_job(j, now=None):
+    now = now or datetime.now()
     score = 0
     deadline = j.get("deadline", "")
     if deadline:
@@ -25,24 +58,24 @@ def score_job(j):
             m = re.search(r"(\d{2})/(\d{2})", deadline)
             if m:
                 # 현재 년도로 설정하며, 마감일이 현재 날짜보다 과거면 내년으로 간주
-                year = datetime.now().year
+                year = now.year
                 month, day = int(m.group(1)), int(m.group(2))
                 dd = datetime(year, month, day)
-                if dd < datetime.now():
+                if dd < now:
                     dd = datetime(year + 1, month, day)
                 
-                d = (dd - datetime.now()).days
+                d = (dd - now).days
                 if d <= 3: score += DEADLINE_IMMINENT_3D
                 elif d <= 7: score += DEADLINE_IMMINENT_7D
         except: pass
     else:
         score += DEADLINE_NONE
-    name = j.get("company", "")
-    if any(k in name for k in BIG_FIRM_HINTS): score += FIRM_BIG
-    elif any(k in name for k in MID_FIRM_HINTS): score += FIRM_MID
+    tier = firm_tier(j.get("company", ""))
+    if tier == "big": score += FIRM_BIG
+    elif tier == "mid": score += FIRM_MID
     try:
         t = datetime.strptime(j.get("crawled_at", ""), "%Y-%m-%d %H:%M:%S")
-        if (datetime.now() - t).days <= 1: score += FRESH_NEW
+        if (now - t).days <= 1: score += FRESH_NEW
         else: score += FRESH_OLD
     except: pass
     salary = j.get("salary", "")
@@ -52,15 +85,138 @@ def score_job(j):
     return score
 
 
+# score_job 의 DataFrame 일괄 버전 (결과 동일, now 는 한 번만 잡음)
+# 컬럼마다 고유값만 뽑아(factorize) 벡터 연산으로 점수를 매긴 뒤 행으로 펼침
+def _unique_scores(col, fn):
+    codes, uniq = pd.factorize(col, use_na_sentinel=False)
+    return fn(pd.Series(uniq, dtype=object))[codes]
+
+def _deadline_points(s, now):
+    s = s.where(s.map(type) == str)
+    m = s.str.extract(r"(\d{2})/(\d{2})").astype(float)
+    ymd = lambda y: pd.to_datetime(pd.DataFrame({"year": y, "month": m[0], "day": m[1]}), errors="coerce")
+    dd = ymd(now.year)
+    dd = dd.where(~(dd < now), ymd(now.year + 1))
+    d = (dd - now).dt.days
+    pts = np.select([d <= 3, d <= 7], [DEADLINE_IMMINENT_3D, DEADLINE_IMMINENT_7D], 0)
+    return np.where(s.eq("").to_numpy(), DEADLINE_NONE, pts)
+
+def _firm_points(s):
+    return s.map(firm_tier).map({"big": FIRM_BIG, "mid": FIRM_MID}).fillna(0).astype(int).to_numpy()
+
+def _fresh_points(s, now):
+    t = pd.to_datetime(s.where(s.map(type) == str), format="%Y-%m-%d %H:%M:%S", errors="coerce")
+    d = (now - t).dt.days
+    return np.select([d <= 1, d > 1], [FRESH_NEW, FRESH_OLD], 0)
+
+def _salary_points(s):
+    s = s.where(s.map(type) == str).fillna("")
+    nums = s.str.extractall(r"(\d{3,4})")[0].astype(int).groupby(level=0).max()
+    top = nums.reindex(s.index, fill_value=0)
+    return np.where((top >= 3500) & ~s.str.contains("협의"), SALARY_GOOD, 0)
+
+# fresh_ids: 변경분의 신규 rec_idx (delta.fresh_ids) — 주면 신선도는 수집 시각 대신 이것으로 (send_kakao 와 같은 기준)
+def score_frame(df, now=None, fresh_ids=None):
+    now = now or datetime.now()
+    col = lambda c: df[c] if c in df.columns else pd.Series("", index=df.index, dtype=object)
+    if fresh_ids is None: fresh = _unique_scores(col("crawled_at"), lambda u: _fresh_points(u, now))
+    else: fresh = np.where(col("rec_idx").astype(str).isin(fresh_ids), FRESH_NEW, FRESH_OLD)
+    score = (
+        _unique_scores(col("deadline"), lambda u: _deadline_points(u, now)) +
+        _unique_scores(col("company"), _firm_points) +
+        fresh +
+        _unique_scores(col("salary"), _salary_points)
+    )
+    return pd.Series(score, index=df.index, dtype=int)
+
+
+# ================== 응답 캐시 ==================
+CACHE_DIR = ".cache/saramin"
+
+# 검색 조건(self.params, 페이지 번호 제외) + 페이지 번호로 키를 만들어 응답 JSON 을 파일로 보관
+class ResponseCache:
+    def __init__(self, cache_dir=CACHE_DIR, ttl=6*3600):
+        self.dir = Path(cache_dir); self.dir.mkdir(parents=True, exist_ok=True)
+        self.ttl = ttl
+
+    def key(self, params, page):
+        norm = {k: str(v) for k, v in params.items() if k != "recruitPage"}
+        h = hashlib.sha1(json.dumps(norm, sort_keys=True, ensure_ascii=False).encode("utf-8")).hexdigest()[:16]
+        return f"{h}_p{page}"
+
+    # ttl=None 이면 만료 무시 (replay 용)
+    def get(self, params, page, ttl=-1):
+        f = self.dir / f"{self.key(params, page)}.json"
+        ttl = self.ttl if ttl == -1 else ttl
+        try:
+            if ttl is not None and time.time() - f.stat().st_mtime > ttl: return None
+            return json.loads(f.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    def put(self, params, page, data):
+        f = self.dir / f"{self.key(params, page)}.json"
+        tmp = f.with_suffix(".tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        os.replace(tmp, f)
+
+
+# ================== 본 공고(rec_idx) 목록 ==================
+# 실행 상태라 공개되는 docs/ 가 아닌 .state/ 에 (워크플로 캐시로 유지)
+STATE_DIR = os.getenv("SARAMIN_STATE_DIR", ".state")
+SEEN_PATH = os.path.join(STATE_DIR, "seen_rec_ids.json")
+LEGACY_SEEN_PATH = "docs/seen_rec_ids.json"   # 예전 위치 — 한 번 읽고 저장할 때 지움
+
+def load_seen_ids(path=SEEN_PATH):
+    if not os.path.exists(path) and path == SEEN_PATH: path = LEGACY_SEEN_PATH
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return set(map(str, json.load(f)))
+    except Exception:
+        return set()
+
+def save_seen_ids(path, ids):
+    Path(path).parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(sorted(ids), f)
+    if path == SEEN_PATH and os.path.exists(LEGACY_SEEN_PATH): os.remove(LEGACY_SEEN_PATH)
+
+
 # ================== Saramin Crawler ==================
+PROC_MIN_PAGES = 20   # parse_procs=None(자동)일 때 이 페이지 수 이상이면 파싱을 프로세스 풀로
+EMPTY_PAGE_RETRIES = 2   # 끝 페이지 전인데 빈 페이지가 오면 다시 받는 횟수 (그래도 비면 RequestFailed)
+STREAM_CHUNK = 5000   # 스트리밍 결과 CSV 를 후속 단계에서 나눠 읽는 행 수
+
 class SaraminCrawler:
-    def __init__(self):
-        self.api_url = "https://www.saramin.co.kr/zf_user/search/get-recruit-list"
+    # workers: 2페이지부터 동시에 받을 최대 요청 수 (1이면 기존처럼 순차 수집)
+    # delay: 모든 워커를 합쳐 요청 시작 사이에 두는 시작 간격(초) = 사람인 서버 예의 예산
+    #        (ratelimit.AdaptiveLimiter 가 응답을 보며 max_rate 까지 올리고, 429/503 이면 낮춤. 0 이면 제한 없음)
+    # cache: ResponseCache (없으면 캐시 안 씀), replay: 캐시에서만 읽고 네트워크는 절대 안 씀
+    # parser: "auto" | "bs4" | "lxml" | "selectolax" (parsers.py)
+    # parse_procs: 파싱 프로세스 수 (0 이면 받은 스레드에서 바로 파싱, None 이면 큰 수집에서만 코어 수 - 1)
+    def __init__(self, workers=4, delay=0.4, api_url=None, cache=None, replay=False, timeout=20, parser="auto",
+                 max_rate=None, retries=4, deadline=60, parse_procs=None):
+        self._parser = get_parser(parser)
+        self.parse_procs = parse_procs
+        self.api_url = api_url or os.getenv("SARAMIN_API_URL", "https://www.saramin.co.kr/zf_user/search/get-recruit-list")
+        self.workers = max(1, int(workers))
+        self.delay = delay
+        if replay and cache is None: cache = ResponseCache()
+        self.cache = cache
+        self.replay = replay
+        self.timeout = timeout
+        self.retries, self.deadline = retries, deadline
+        rate = 1 / delay if delay else float("inf")
+        self.limiter = AdaptiveLimiter(rate=rate, max_rate=max_rate or rate * 4, min_rate=rate / 8, step=rate / 20)
         self.headers = {
             "User-Agent": "Mozilla/5.0",
             "Referer": "https://www.saramin.co.kr/zf_user/search",
             "X-Requested-With": "XMLHttpRequest",
         }
+        # keep-alive 연결을 동시 요청 수(기본: 워커 수)만큼 재사용
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self._mount(self.workers)
         self.params = {
             "searchType": "search",
             "loc_mcd": "106000,104000,105000,107000,110000,111000",
@@ -78,68 +234,241 @@ class SaraminCrawler:
             "recruitSort": "relation"
         }
 
-    def _parse_page(self, html):
-        soup = BeautifulSoup(html, "html.parser")
-        jobs = []
-        for item in soup.select("div.item_recruit"):
-            try:
-                rec_idx = (item.get("value") or "").strip()
-                a = item.select_one("h2.job_tit a")
-                if not a: continue
-                title = a.get_text(strip=True)
-                href = a.get("href", "")
-                link = "https://www.saramin.co.kr" + href if href.startswith("/") else href
-                corp_el = item.select_one("strong.corp_name a, strong.corp_name")
-                company = corp_el.get_text(strip=True) if corp_el else ""
-                info = item.select("div.job_condition span")
-                location = info[0].get_text(strip=True) if len(info)>0 else ""
-                career = info[1].get_text(strip=True) if len(info)>1 else ""
-                edu = info[2].get_text(strip=True) if len(info)>2 else ""
-                deadline_el = item.select_one("div.job_date span.date")
-                deadline = deadline_el.get_text(strip=True) if deadline_el else ""
-                jobs.append({
-                    "rec_idx": rec_idx, "title": title, "company": company,
-                    "location": location, "career": career, "education": edu,
-                    "deadline": deadline, "link": link, "salary": "",
-                    "crawled_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                })
-            except: continue
-        return jobs
-
-    def _fetch(self, page):
-        p = dict(self.params)
+    def _mount(self, pool_size):
+        adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter); self.session.mount("http://", adapter)
+
+    # 모든 사람인 요청의 공통 경로: 공유 속도 제한 + 재시도/백오프 + 요청당 마감 시간
+    def _request(self, url, params=None):
+        t0 = time.perf_counter()
+        r = ratelimit.request(self.session, "GET", url, self.limiter, params=params,
+                              retries=self.retries, deadline=self.deadline, timeout=self.timeout)
+        METRICS.observe("request_ms", (time.perf_counter() - t0) * 1000)
+        METRICS.count("requests"); METRICS.count("bytes_downloaded", len(r.content))
+        r.raise_for_status()
+        return r
+
+    # params: 검색 조건 (없으면 self.params). 여러 검색 프로필이 세션/캐시/속도 예산을 함께 씀
+    def _get_page_data(self, page, params=None):
+        params = params or self.params
+        if self.cache:
+            data = self.cache.get(params, page, ttl=None if self.replay else -1)
+            if data is not None: return data
+        if self.replay:
+            print(f"⚠️ replay: 캐시에 {page}페이지 없음"); return {}
+        p = dict(params)
         p["recruitPage"]=page
-        r = requests.get(self.api_url, params=p, headers=self.headers)
-        data = r.json()
-        html = data.get("innerHTML","")
-        cnt = int(str(data.get("count","0")).replace(",","") or 0)
-        return self._parse_page(html), cnt
+        # 재시도 후에도 실패하면 예외 → 결과가 조용히 잘리지 않음
+        data = self._request(self.api_url, p).json()
+        if self.cache and data.get("innerHTML"): self.cache.put(params, page, data)
+        return data
+
+    # 공고를 하나씩 yield (파서 엔진도 generator)
+    def _parse_page(self, html):
+        yield from self._parser(html)
+
+    def _fetch_raw(self, page, params=None):
+        data = self._get_page_data(page, params)
+        return data.get("innerHTML",""), int(str(data.get("count","0")).replace(",","") or 0)
+
+    def _fetch(self, page, params=None):
+        html, cnt = self._fetch_raw(page, params)
+        with METRICS.stage("parse"):
+            jobs = list(self._parse_page(html))
+        METRICS.count("pages"); METRICS.count("rows", len(jobs))
+        return jobs, cnt
+
+    # 받은 innerHTML 을 파싱 프로세스 풀에 넘기고 바로 다음 요청으로 (파싱이 네트워크를 막지 않음)
+    def _fetch_to_pool(self, pool, page, params=None):
+        html, cnt = self._fetch_raw(page, params)
+        return pool.submit(parse_page, self._parser, html), cnt
+
+    # 알려진 끝 페이지 전인데 빈 페이지(200 이지만 innerHTML 이 비었거나 파싱 안 됨) → 다시 받고, 그래도 비면 예외
+    # 단, 그 응답의 총 건수로 보면 이미 끝을 넘은 페이지면(수집 중 공고가 마감돼 줄어듦) 정상 종료로 [] 반환
+    def _refetch_empty(self, page, cnt, params):
+        per = int(params["recruitPageCount"])
+        past_end = lambda cnt: cnt and (page - 1) * per >= cnt
+        if self.replay: return []
+        for _ in range(EMPTY_PAGE_RETRIES):
+            if past_end(cnt): return []
+            METRICS.count("empty_page_retries")
+            jobs, cnt = self._fetch(page, params)
+            if jobs: return jobs
+        if past_end(cnt): return []
+        raise ratelimit.RequestFailed(f"{page}페이지가 비어 있음 (총 {cnt}건, {EMPTY_PAGE_RETRIES}회 다시 받음)")
+
+    def _parse_pool(self, pages):
+        procs = self.parse_procs
+        if procs is None:
+            procs = (os.cpu_count() or 1) - 1 if pages >= PROC_MIN_PAGES else 0
+        if procs <= 0: return nullcontext()
+        # 스레드가 도는 프로세스를 fork 하지 않도록 forkserver (없으면 spawn)
+        methods = multiprocessing.get_all_start_methods()
+        ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+        return ProcessPoolExecutor(max_workers=procs, mp_context=ctx)
+
+    # (받기 스레드 풀, 파싱 프로세스 풀 또는 None)
+    @contextmanager
+    def _pools(self, pages):
+        with ThreadPoolExecutor(max_workers=self.workers) as ex, self._parse_pool(pages) as pool:
+            yield ex, pool
+
+    # 페이지 단위로 공고 목록을 페이지 순서대로 yield
+    # 2..N 페이지는 워커 풀에서 동시에 받되, 미리 받아두는 페이지는 workers*2 개까지만 (메모리 상한)
+    # 파싱 프로세스 풀이 있으면: 받기(스레드) → 파싱(프로세스) 파이프라인. 같은 창(window)이
+    # 받는 중 + 파싱 대기 + 파싱 완료 페이지를 모두 세므로 메모리 상한과 페이지 순서는 그대로
+    # shared: 다른 호출과 나눠 쓸 _pools() 결과 (crawl_profiles) — 없으면 이 호출만의 풀을 만듦
+    def iter_pages(self, params=None, shared=None):
+        params = params or self.params
+        first, total = self._fetch(1, params)
+        if not first and total: first = self._refetch_empty(1, total, params)
+        if not first: return
+        yield first
+        pages = math.ceil(total / int(params["recruitPageCount"]))
+        todo = iter(range(2, pages+1))
+        with (nullcontext(shared) if shared else self._pools(pages-1)) as (ex, pool):
+            submit = (lambda p: ex.submit(self._fetch_to_pool, pool, p, params)) if pool else \
+                     (lambda p: ex.submit(self._fetch, p, params))
+            window = deque((p, submit(p)) for p in islice(todo, self.workers*2))
+            while window:
+                page, fut = window.popleft()
+                jobs, cnt = fut.result()
+                if pool:
+                    jobs, sec = jobs.result()
+                    METRICS.add_time("parse", sec)
+                    METRICS.count("pages"); METRICS.count("rows", len(jobs))
+                if not jobs: jobs = self._refetch_empty(page, cnt, params)
+                if not jobs:
+                    for _, rest in window: rest.cancel()
+                    break
+                for p in islice(todo, 1): window.append((p, submit(p)))
+                yield jobs
 
     def crawl_all(self):
-        all_jobs, first = [], None
-        first, total = self._fetch(1)
-        if not first: return pd.DataFrame()
-        all_jobs.extend(first)
-        pages = math.ceil(total / int(self.params["recruitPageCount"]))
-        for p in range(2, pages+1):
-            jobs,_ = self._fetch(p)
-            if not jobs: break
-            all_jobs.extend(jobs)
-            time.sleep(0.4)
-        df = pd.DataFrame(all_jobs)
-        if df.empty: return df
+        all_jobs = [j for jobs in self.iter_pages() for j in jobs]
+        if not all_jobs: return pd.DataFrame()
+        df = compact_frame(pd.DataFrame(all_jobs, columns=JOB_FIELDS))
         df.drop_duplicates(subset=["rec_idx"], inplace=True)
-        df["score"] = df.apply(score_job, axis=1)
+        df["score"] = score_frame(df)
         df = df.sort_values("score",ascending=False).reset_index(drop=True)
         return df
 
+    # 스트리밍 수집: 페이지가 도착하는 대로 rec_idx 중복 제거 → 점수 계산 → CSV 에 바로 append
+    # 전체 목록은 메모리에 두지 않고, 순위는 상위 top_k 개만 힙으로 유지 → 점수순 DataFrame 반환
+    def crawl_stream(self, csv_path, top_k=100):
+        seen, heap, n = set(), [], 0
+        with open(csv_path, "w", newline="", encoding="utf-8-sig") as f:
+            w = csv.writer(f)
+            w.writerow(JOB_FIELDS + ["score"])
+            for jobs in self.iter_pages():
+                for j in jobs:
+                    if j.rec_idx in seen: continue
+                    seen.add(j.rec_idx)
+                    sc = score_job(j)
+                    w.writerow((*j, sc)); n += 1
+                    # 점수 같으면 먼저 들어온 공고 우선
+                    entry = (sc, -n, j)
+                    if len(heap) < top_k: heapq.heappush(heap, entry)
+                    elif entry[:2] > heap[0][:2]: heapq.heapreplace(heap, entry)
+                f.flush()
+        print(f"✅ 스트리밍 수집 완료: {n}건 → {csv_path}")
+        top = [(*j, sc) for sc, _, j in sorted(heap, key=lambda e: e[:2], reverse=True)]
+        return compact_frame(pd.DataFrame(top, columns=JOB_FIELDS + ["score"]))
+
+    # 등록일순으로 앞 페이지부터 받다가, 이미 본 공고가 stop_after 개 연속 나오면 중단
+    # (새 공고 목록, 요청한 페이지 수, 전체 페이지 수) 반환. seen 은 읽기만 함 — 중간 페이지에서 실패해도
+    # 받다 만 공고가 "본 것"으로 남지 않도록, 새 공고를 저장한 뒤 호출한 쪽에서 seen 에 추가
+    def fetch_new(self, seen, stop_after=20, params=None):
+        params = dict(params or self.params, recruitSort="reg_dt")
+        new_jobs, fresh, known_run, page, pages = [], set(), 0, 1, 1
+        while page <= pages and known_run < stop_after:
+            jobs, total = self._fetch(page, params)
+            if not jobs and total: jobs = self._refetch_empty(page, total, params)
+            if not jobs: break
+            pages = math.ceil(total / int(params["recruitPageCount"]))
+            for j in jobs:
+                if j.rec_idx in seen or j.rec_idx in fresh:
+                    known_run += 1
+                    if known_run >= stop_after: break
+                else:
+                    known_run = 0
+                    fresh.add(j.rec_idx); new_jobs.append(j)
+            page += 1
+        return new_jobs, page-1, pages
+
+    # 증분 수집: 새 공고만 이전 스냅샷(prev_df)에 합치고 전체 점수를 다시 매김. keep_days 보다 오래된 공고는 정리
+    def crawl_incremental(self, prev_df=None, seen_path=SEEN_PATH, stop_after=20, keep_days=60):
+        seen = load_seen_ids(seen_path)
+        if prev_df is not None and not prev_df.empty: seen |= set(prev_df["rec_idx"].astype(str))
+        new_jobs, requested, pages = self.fetch_new(seen, stop_after)
+        print(f"✅ 증분 수집: {requested}/{pages}페이지 요청, 새 공고 {len(new_jobs)}건")
+        df = merge_new(prev_df, new_jobs, keep_days)
+        save_seen_ids(seen_path, seen | {j.rec_idx for j in new_jobs})
+        return df
+
+    # 여러 검색 프로필 동시 수집 {이름: self.params 에서 바꿀 값}
+    # 세션/캐시/속도 예산은 공유하고, 도착하는 대로 rec_idx 로 전역 중복 제거
+    # 각 공고의 profiles 컬럼에 걸린 프로필 이름을 "|" 로 이어 붙임
+    # 프로필마다 풀을 따로 만들지 않고 받기 스레드 풀 / 파싱 프로세스 풀을 하나씩 나눠 씀
+    # 동시 HTTP 요청 = 공용 워커 + 프로필별 1페이지(재요청) → 연결 풀도 그만큼
+    def crawl_profiles(self, profiles):
+        merged, lock = {}, threading.Lock()
+        def run(name, overrides, shared):
+            params = dict(self.params, **overrides)
+            n = 0
+            for jobs in self.iter_pages(params, shared):
+                with lock:
+                    for j in jobs:
+                        hit = merged.get(j.rec_idx)
+                        if hit is None:
+                            merged[j.rec_idx] = (j, [name]); n += 1
+                        elif name not in hit[1]:
+                            hit[1].append(name)
+            print(f"✅ 프로필 '{name}': 새 공고 {n}건")
+        self._mount(self.workers + len(profiles))
+        # 페이지 수는 프로필마다 1페이지를 받아야 알 수 있으므로, 자동(parse_procs=None)이면 큰 수집으로 보고 파싱 풀 사용
+        with self._pools(PROC_MIN_PAGES) as shared, ThreadPoolExecutor(max_workers=len(profiles) or 1) as drivers:
+            for f in [drivers.submit(run, name, ov, shared) for name, ov in profiles.items()]: f.result()
+
+        if not merged: return pd.DataFrame()
+        df = compact_frame(pd.DataFrame([j for j, _ in merged.values()], columns=JOB_FIELDS))
+        df["profiles"] = ["|".join(names) for _, names in merged.values()]
+        df["score"] = score_frame(df)
+        return df.sort_values("score",ascending=False).reset_index(drop=True)
+
     # ✅ 지원완료 컬럼 포함 HTML 생성
-    def build_html(self, df, path):
+    # 카드를 파일에 바로 써 내려감 (문자열 누적 없음). page_size 를 주면
+    # <이름>_p1.html, _p2.html ... 로 나누고 path 에는 상위 index_top 개 + 페이지 목록만 담은 인덱스를 씀
+    def build_html(self, df, path, page_size=None, index_top=10):
         p = Path(path); p.parent.mkdir(exist_ok=True, parents=True)
-        if "status" not in df.columns: df["status"] = ""
-        if "applied_at" not in df.columns: df["applied_at"] = ""
-        html = """
+        rows = df.reindex(columns=CARD_FIELDS).fillna("")
+        n = len(rows)
+        if not page_size or n <= page_size:
+            with open(p, "w", encoding="utf-8") as f:
+                _write_cards(f, rows.itertuples(index=False))
+            print(f"✅ HTML 생성 완료 → {path}")
+            return [p]
+
+        pages = math.ceil(n / page_size)
+        names = [f"{p.stem}_p{i}.html" for i in range(1, pages+1)]
+        nav = " ".join(f"<a href='{nm}'>{i}</a>" for i, nm in enumerate(names, start=1))
+        for i, nm in enumerate(names):
+            chunk = rows.iloc[i*page_size:(i+1)*page_size]
+            with open(p.parent / nm, "w", encoding="utf-8") as f:
+                _write_cards(f, chunk.itertuples(index=False),
+                             heading=f"🎯 AI 추천 채용공고 ({i+1}/{pages})", nav=f"<a href='{p.name}'>목록</a> · {nav}")
+        with open(p, "w", encoding="utf-8") as f:
+            _write_cards(f, rows.head(index_top).itertuples(index=False),
+                         heading=f"🎯 AI 추천 채용공고 TOP {min(index_top, n)} / 총 {n}건", nav=nav)
+        print(f"✅ HTML 생성 완료 → {path} (+ {pages}페이지, 페이지당 {page_size}건)")
+        return [p] + [p.parent / nm for nm in names]
+
+
+# ================== HTML 렌더링 ==================
+CARD_FIELDS = ["title","company","location","career","education","deadline","score","status","applied_at","link"]
+HTML_HEAD = """
         <html><head><meta charset="UTF-8">
+        <meta name="viewport" content="width=device-width,initial-scale=1">
         <style>
         body{font-family:"Pretendard","Apple SD Gothic Neo",sans-serif;background:#f9fafb;margin:0;}
         h2{text-align:center;color:#2563eb;padding:20px 0;}
@@ -151,82 +480,176 @@ class SaraminCrawler:
         .status{font-size:0.9rem;font-weight:600;color:#16a34a;margin-top:8px;}
         .button{display:inline-block;margin-top:10px;padding:8px 14px;background:#2563eb;color:#fff;
         border-radius:6px;text-decoration:none;}
-        </style></head><body><h2>🎯 AI 추천 채용공고</h2>
-        """
-        for _, r in df.iterrows():
-            status_html = f"<div class='status'>✅ 지원완료 ({r['applied_at']})</div>" if r["status"]=="applied" else ""
-            html += f"""
+        .nav{text-align:center;margin:16px auto;max-width:600px;line-height:2;}
+        .nav a{margin:0 4px;color:#2563eb;}
+        </style></head><body>"""
+
+def _card(r):
+    e = lambda v: html_escape(str(v))
+    status_html = f"<div class='status'>✅ 지원완료 ({e(r.applied_at)})</div>" if r.status=="applied" else ""
+    return f"""
             <div class="card">
-              <div class="title">{r['title']}</div>
-              <div class="company">{r['company']}</div>
-              <div class="meta">{r['location']} · {r['career']} · {r['education']} · 마감일: {r['deadline']} · 점수: {r['score']}</div>
+              <div class="title">{e(r.title)}</div>
+              <div class="company">{e(r.company)}</div>
+              <div class="meta">{e(r.location)} · {e(r.career)} · {e(r.education)} · 마감일: {e(r.deadline)} · 점수: {e(r.score)}</div>
               {status_html}
-              <a href="{r['link']}" class="button" target="_blank">🔗 공고 바로가기</a>
+              <a href="{e(r.link)}" class="button" target="_blank">🔗 공고 바로가기</a>
             </div>
             """
-        html += "</body></html>"
-        p.write_text(html, encoding="utf-8")
-        print(f"✅ HTML 생성 완료 → {path}")
 
+def _write_cards(f, rows, heading="🎯 AI 추천 채용공고", nav=""):
+    nav_html = f"<div class='nav'>{nav}</div>" if nav else ""
+    f.write(f"{HTML_HEAD}<h2>{heading}</h2>{nav_html}\n")
+    f.writelines(_card(r) for r in rows)
+    f.write(f"{nav_html}</body></html>")
+
+
+# ================== JSON 피드 ==================
+# send_kakao.py 등이 HTML 을 다시 파싱하지 않도록, 점수순 공고를 JSON lines 로 함께 내보냄
+FEED_PATH = "docs/saramin_results_latest.jsonl"
+FEED_FIELDS = ["rec_idx","title","company","location","career","education","deadline","link","salary","score","status","applied_at"]
 
-# ✅ Gmail에서 지원완료 반영 (Secrets 기반으로 수정)
-def update_from_mail(csv_path):
+def write_feed(df, path=FEED_PATH):
+    p = Path(path); p.parent.mkdir(exist_ok=True, parents=True)
+    now = datetime.now()
+    rows = df.reindex(columns=FEED_FIELDS).fillna("")
+    tmp = p.with_suffix(".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        for rank, r in enumerate(rows.itertuples(index=False), start=1):
+            rec = {k: (v.item() if hasattr(v, "item") else v) for k, v in zip(FEED_FIELDS, r)}
+            rec["rec_idx"] = str(rec["rec_idx"])
+            dd = deadline_date(rec["deadline"], now)
+            rec.update(rank=rank, deadline_date=dd.isoformat() if dd else None)
+            f.write(json.dumps(rec, ensure_ascii=False) + "\n")
+    os.replace(tmp, p)
+    print(f"✅ JSON 피드 생성 완료 → {path} ({len(rows)}건)")
+
+
+# ✅ Gmail 지원완료 메일에서 회사명 목록 추출 (Secrets 기반). 건너뛰거나 오류면 None
+def applied_companies_from_mail():
     SCOPES = ['https://www.googleapis.com/auth/gmail.readonly']
     token_env = os.getenv("GOOGLE_TOKEN_JSON")
     
     # GOOGLE_TOKEN_JSON 환경 변수가 없으면 Gmail 업데이트 기능을 건너뜁니다.
     if not token_env:
         print("❌ GOOGLE_TOKEN_JSON 환경 변수 없음. Gmail 업데이트 건너뜀.")
-        return pd.read_csv(csv_path)
+        return None
     
+    # 구글 API 클라이언트는 import 가 느려서 실제로 메일을 볼 때만 불러옴
+    from google.oauth2.credentials import Credentials
+    from googleapiclient.discovery import build
     try:
         print("✅ GitHub Secret 환경 변수에서 Gmail 토큰 사용...")
         # 환경 변수에서 JSON 문자열을 로드하여 자격 증명 생성
         creds = Credentials.from_authorized_user_info(json.loads(token_env), SCOPES)
     except Exception as e:
-        # 구문 오류 수정된 부분
         print(f"❌ Gmail 토큰 로드 중 오류 발생: {e}. Gmail 업데이트 건너뜀.") 
-        return pd.read_csv(csv_path)
+        return None
 
     try:
         service = build('gmail', 'v1', credentials=creds)
-        query = '(subject:"입사지원 완료" OR subject:"지원이 완료되었습니다" OR subject:"성공적으로 완료되었습니다")'
-        # 최신 10개의 지원 완료 메일만 확인
-        results = service.users().messages().list(userId='me', q=query, maxResults=10).execute()
-        messages = results.get('messages', [])
-        
-        df = pd.read_csv(csv_path, encoding='utf-8')
-        if "status" not in df.columns: df["status"] = ""
-        if "applied_at" not in df.columns: df["applied_at"] = ""
-        
-        if not messages:
-            print("📭 새 지원완료 메일 없음.")
-            return df
-
-        for m in messages:
-            # 메일 상세 정보 가져오기
-            msg = service.users().messages().get(userId='me', id=m['id']).execute()
-            subject = next((h['value'] for h in msg['payload']['headers'] if h['name'] == 'Subject'), "")
-            # '[사람인] 회사명에 입사지원이 완료' 등의 패턴 매칭
-            match = re.search(r"\[사람인\]\s*(.+?)에\s*입사지원이\s*(?:성공적으로\s*)?완료", subject)
-            
-            if not match: continue
-            
-            company = match.group(1).strip()
-            print(f"📨 지원완료 메일 감지: {company}")
-            
-            # 회사 이름이 포함된 모든 행의 상태 업데이트
-            mask = df["company"].str.contains(company, na=False, regex=False)
-            df.loc[mask, "status"] = "applied"
-            df.loc[mask, "applied_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-
-        df.to_csv(csv_path, index=False, encoding='utf-8-sig')
-        print("✅ CSV 상태 업데이트 완료")
+        # 지난 실행 이후 추가된 메일만 historyId 로 조회하고, 이전에 찾은 회사명과 합침 (gmail_sync.py)
+        companies = gmail_sync.sync_applied(service)
+        for company in companies: print(f"📨 지원완료 메일 감지: {company}")
+        return companies
+    except Exception as e:
+        print(f"❌ Gmail API 통신 중 오류 발생: {e}.")
+        return None
+
+
+# 메일의 회사명과 일치하는 행을 지원완료로 표시하고, 바뀐 행 마스크를 돌려줌
+# companies: {회사명: 메일 받은 시각} (목록이면 시각 모름). applied_at 은 메일 시각,
+# 모르면 이미 지원완료로 찍힌 값을 그대로 두고 처음 찍는 행만 지금 시각
+# 회사명 인덱스는 실행마다 한 번만 만들고, 모든 매칭 결과를 한 번에 대입
+def mark_applied(df, companies):
+    if not isinstance(companies, dict): companies = dict.fromkeys(companies, "")
+    # 빈 컬럼(float64)이나 다른 경로로 만든 DataFrame 이어도 문자열을 넣을 수 있게 object 로
+    for c in ("status", "applied_at"):
+        df[c] = df[c].astype(object) if c in df.columns else ""
+    old = df["applied_at"].astype(object).where(df["status"].astype(object).eq("applied"), None)
+    old = old.where(old.notna() & old.astype(str).ne(""), None).tolist()
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    index = CompanyIndex(df["company"])
+    at = [None] * len(df)
+    for company, received in companies.items():
+        for pos in index.lookup(company):
+            t = received or old[pos] or now
+            if at[pos] is None or t < at[pos]: at[pos] = t
+    hit = pd.Series([t is not None for t in at], index=df.index)
+    df.loc[hit, "status"] = "applied"
+    df.loc[hit, "applied_at"] = [t for t in at if t is not None]
+    return hit
+
+
+# ✅ Gmail에서 지원완료 반영
+#   store 가 있으면 DB 가 원본: 마지막 실행 결과에 표시하고, 상태가 바뀐 rec_idx 만 단일 행 UPDATE (CSV 는 건드리지 않음)
+#   없으면 CSV 를 읽어 표시하고 다시 씀
+#   chunksize 를 주면(스트리밍 결과) CSV 를 chunksize 행씩 읽어 표시하고 임시 파일에 이어 쓴 뒤 교체 — 반환값 없음
+def update_from_mail(csv_path=None, store=None, chunksize=None):
+    if chunksize and store is None:
+        companies = applied_companies_from_mail()
+        if companies: _mark_csv_chunks(csv_path, companies, chunksize)
+        else: print("ℹ️ 기존 결과를 그대로 사용합니다." if companies is None else "📭 새 지원완료 메일 없음.")
+        return None
+    df = compact_frame(store.current()) if store is not None else load_results_csv(csv_path)
+    companies = applied_companies_from_mail()
+    if companies is None:
+        print("ℹ️ 기존 결과를 그대로 사용합니다.")
+        return df
+    if not companies:
+        print("📭 새 지원완료 메일 없음.")
         return df
 
-    except Exception as e:
-        print(f"❌ Gmail API 통신 중 오류 발생: {e}. 기존 CSV 파일을 반환합니다.")
-        return pd.read_csv(csv_path)
+    before = df.reindex(columns=["status", "applied_at"]).astype(object).fillna("").astype(str)
+    hit = mark_applied(df, companies)
+    if store is not None:
+        changed = hit & ((before["status"] != "applied") | (before["applied_at"] != df["applied_at"].astype(str)))
+        store.set_status(df.loc[changed, "rec_idx"], "applied", df.loc[changed, "applied_at"])
+        print(f"✅ DB 지원 상태 갱신 {int(changed.sum())}건")
+        return df
+    df.to_csv(csv_path, index=False, encoding='utf-8-sig')
+    print("✅ CSV 상태 업데이트 완료")
+    return df
+
+def _mark_csv_chunks(csv_path, companies, chunksize):
+    tmp, n = f"{csv_path}.tmp", 0
+    for i, chunk in enumerate(iter_results_csv(csv_path, chunksize)):
+        n += int(mark_applied(chunk, companies).sum())
+        # BOM 은 파일 맨 앞에 한 번만
+        chunk.to_csv(tmp, mode="a" if i else "w", header=not i, index=False, encoding="utf-8" if i else "utf-8-sig")
+    os.replace(tmp, csv_path)
+    print(f"✅ CSV 상태 업데이트 완료 (지원완료 {n}건)")
+
+
+# 새 결과 CSV 이름 — 마이크로초까지 넣어 1초 안에 두 번 써도 이름(= 변경분 source 키)이 겹치지 않음
+def results_csv_name():
+    return f"saramin_results_{datetime.now():%Y%m%d_%H%M%S_%f}.csv"
+
+# 가장 최근 결과 CSV (없으면 None)
+def latest_csv():
+    files = sorted(Path(".").glob("saramin_results_*.csv"), key=lambda x: x.stat().st_mtime, reverse=True)
+    return files[0] if files else None
+
+# 지원 상태 컬럼은 비어 있어도(float64 NaN) 문자열로 읽어야 나중에 "applied" 를 대입할 수 있음
+RESULT_DTYPE = {"rec_idx": str, "status": str, "applied_at": str, **{c: "category" for c in CATEGORY_COLS}}
+
+def load_results_csv(path):
+    return compact_frame(pd.read_csv(path, dtype=RESULT_DTYPE, encoding="utf-8-sig"))
+
+# 결과 CSV 를 chunksize 행씩 — 스트리밍 수집 결과를 통째로 메모리에 올리지 않을 때
+def iter_results_csv(path, chunksize=STREAM_CHUNK):
+    for chunk in pd.read_csv(path, dtype=RESULT_DTYPE, encoding="utf-8-sig", chunksize=chunksize):
+        yield compact_frame(chunk)
+
+# 결과 CSV 의 점수 상위 top_k — 같은 점수면 앞 행 우선 (crawl_stream 의 힙과 같은 순서)
+# fresh_ids 를 주면 청크마다 점수를 변경분 기준 신선도로 다시 매긴 뒤 고름
+def top_results_csv(path, top_k, chunksize=STREAM_CHUNK, fresh_ids=None):
+    top = None
+    for chunk in iter_results_csv(path, chunksize):
+        if fresh_ids is not None: chunk["score"] = score_frame(chunk, fresh_ids=fresh_ids)
+        if top is not None: chunk = pd.concat([top, chunk], ignore_index=True)
+        top = chunk.nlargest(top_k, "score", keep="first")
+    return compact_frame(top.reset_index(drop=True))
 
 
 def clean_old_csv():
@@ -240,32 +663,16 @@ def clean_old_csv():
             print(f"❌ 파일 삭제 오류: {f} - {e}")
 
 
-# ================= MAIN ==================
-if __name__ == "__main__":
-    crawler = SaraminCrawler()
-    df = crawler.crawl_all()
-    if df.empty:
-        print("❌ 데이터 없음"); exit()
-
-    ts = datetime.now().strftime('%Y%m%d_%H%M%S')
-    csv_path = f"saramin_results_{ts}.csv"
-    df.to_csv(csv_path,index=False,encoding="utf-8-sig")
-    print(f"✅ CSV 저장: {csv_path}")
-    clean_old_csv()
-
-    # ✅ Gmail에서 지원완료 메일 반영 
-    df = update_from_mail(csv_path)
-
-    # ✅ 반영된 데이터로 HTML 생성
-    html_path = "docs/saramin_results_latest.html"
-    crawler.build_html(df, html_path)
-
-    # ✅ 이메일 전송
+# ✅ 상위 10개 공고 메일 발송 (Gmail SMTP)
+def send_digest_email(df):
+    import smtplib
+    from email.mime.text import MIMEText
+    from email.mime.multipart import MIMEMultipart
     EMAIL_SENDER = os.getenv("EMAIL_SENDER")
     EMAIL_RECEIVER = os.getenv("EMAIL_RECEIVER")
     EMAIL_APP_PASSWORD = os.getenv("EMAIL_APP_PASSWORD")
     if not all([EMAIL_SENDER, EMAIL_RECEIVER, EMAIL_APP_PASSWORD]):
-        print("❌ 이메일 환경 변수(SENDER, RECEIVER, PASSWORD)가 설정되지 않음. 이메일 전송 건너뜀."); exit()
+        print("❌ 이메일 환경 변수(SENDER, RECEIVER, PASSWORD)가 설정되지 않음. 이메일 전송 건너뜀."); return
 
     try:
         top10 = df.head(10).to_dict(orient="records")
@@ -274,7 +681,7 @@ if __name__ == "__main__":
         msg['Subject'] = f"🎯 AI 추천 채용공고 - {datetime.now().strftime('%Y-%m-%d')}"
         html = "<h2>🎯 AI 추천 TOP 10 채용공고</h2>"
         for j in top10:
-            status_txt = f"<div style='color:green;'>✅ 지원완료 ({j.get('applied_at','')[:10]})</div>" if j.get('status')=="applied" else ""
+            status_txt = f"<div style='color:green;'>✅ 지원완료 ({str(j.get('applied_at',''))[:10]})</div>" if j.get('status')=="applied" else ""
             html += f"""
             <div style='border:1px solid #eee;border-radius:8px;padding:10px;margin:8px;'>
             <b>{j['title']}</b> - {j['company']}<br>
@@ -288,4 +695,11 @@ if __name__ == "__main__":
         s.send_message(msg); s.quit()
         print("📧 이메일 전송 완료!")
     except Exception as e:
-        print(f"❌ 이메일 전송 중 오류 발생: {e}")
\ No newline at end of file
+        print(f"❌ 이메일 전송 중 오류 발생: {e}")
+
+
+# ================= MAIN ==================
+# 예전 실행 방식 유지: python test.py [옵션] == python cli.py run [옵션]
+if __name__ == "__main__":
+    from cli import main
+    main(["run", *sys.argv[1:]])
@@ -1,8 +1,10 @@
 # update_from_mail_debug.py
-import re, csv
+import csv
 from datetime import datetime
 from google.oauth2.credentials import Credentials
 from googleapiclient.discovery import build
+import gmail_sync
+from company_index import CompanyIndex
 
 SCOPES = ['https://www.googleapis.com/auth/gmail.readonly']
 TOKEN_PATH = r"c:/Users/pkill/Desktop/recruit_crawler-master/recruit_crawler-master/token.json"
@@ -11,25 +13,18 @@ def check_and_update_csv(csv_path):
     creds = Credentials.from_authorized_user_file(TOKEN_PATH, SCOPES)
     service = build('gmail', 'v1', credentials=creds)
 
-    # Gmail 검색 쿼리
-    query = '(subject:"입사지원 완료" OR subject:"지원이 완료되었습니다" OR subject:"성공적으로 완료되었습니다")'
-    results = service.users().messages().list(
-        userId='me',
-        q=query,
-        maxResults=10
-    ).execute()
-
-    messages = results.get('messages', [])
-    if not messages:
+    # 지원완료 메일 전체를 Subject 헤더만 배치로 한 번만 조회
+    ids = gmail_sync.list_message_ids(service)
+    if not ids:
         print("📭 새 지원완료 메일 없음.")
         return
+    meta = gmail_sync.fetch_metadata(service, ids)
+    subjects = {mid: subject for mid, (subject, _) in meta.items()}
 
     # 최근 5개 제목 출력 (디버그용)
     print("📋 최근 메일 제목:")
-    for m in messages[:5]:
-        msg = service.users().messages().get(userId='me', id=m['id']).execute()
-        subject = next((h['value'] for h in msg['payload']['headers'] if h['name'] == 'Subject'), "")
-        print("   →", subject)
+    for mid in ids[:5]:
+        print("   →", subjects.get(mid, ""))
 
     # CSV 로드
     rows = []
@@ -41,23 +36,20 @@ def check_and_update_csv(csv_path):
             fieldnames += ["status", "applied_at"]
         rows = list(reader)
 
-    # 정규식 패턴 강화
-    for m in messages:
-        msg = service.users().messages().get(userId='me', id=m['id']).execute()
-        subject = next((h['value'] for h in msg['payload']['headers'] if h['name'] == 'Subject'), "")
-        
-        # 예시: [사람인] (주)애니아이티에 입사지원이 성공적으로 완료되었습니다.
-        match = re.search(r"\[사람인\]\s*(.+?)에\s*입사지원이\s*(?:성공적으로\s*)?완료", subject)
-        if not match:
+    # 회사명 인덱스를 한 번 만들고 메일마다 정확/접두 일치로 조회
+    index = CompanyIndex(row["company"] for row in rows)
+    now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    # 메일은 최신순 → 같은 회사의 가장 오래된 메일 시각이 마지막에 남음
+    for mid in ids:
+        company = gmail_sync.parse_applied_company(subjects.get(mid))
+        if not company:
             continue
-        company = match.group(1).strip()
         print(f"📨 지원 완료 메일 감지: {company}")
 
-        for row in rows:
-            if company in row["company"]:
-                row["status"] = "applied"
-                row["applied_at"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                updated = True
+        for pos in index.lookup(company):
+            rows[pos]["status"] = "applied"
+            rows[pos]["applied_at"] = meta[mid][1] or now
+            updated = True
 
     # 저장
     if updated:
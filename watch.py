@@ -0,0 +1,77 @@
+# -*- coding: utf-8 -*-
+# 감시 모드: 상주하면서 등록일순 첫 페이지만 짧은 간격으로 확인
+#   - 크롤러(keep-alive 세션, 파서, 속도 제한기)는 한 번 만들어 계속 재사용
+#   - 모르는 rec_idx 가 나올 때만 다음 페이지로 내려감 (SaraminCrawler.fetch_new) → 평소엔 주기당 요청 1번
+#   - 새 공고가 있으면 결과에 합쳐 CSV 를 새로 쓰고 (store 가 있으면 CSV 대신 DB 에 새 실행으로 upsert)
+#     on_change(df, source) 로 후속 단계(delta/render/notify) 실행 — source 는 CSV 경로 또는 store.run_name
+#   python cli.py watch --interval 300 --notify
+import random, signal, threading
+from datetime import datetime
+import requests
+from test import merge_new, load_seen_ids, save_seen_ids, clean_old_csv, results_csv_name, SEEN_PATH, METRICS
+from ratelimit import RequestFailed
+
+MAX_BACKOFF = 8   # 연속 실패 시 간격을 최대 이 배수까지 늘림
+
+class Watcher:
+    # df: 지금까지의 결과 (없으면 첫 확인에서 끝 페이지까지 내려가 전체를 받음), store: JobStore (cli.py --db)
+    def __init__(self, crawler, df=None, interval=300, stop_after=20, keep_days=60, on_change=None, seen_path=SEEN_PATH,
+                 store=None):
+        self.crawler, self.df, self.store = crawler, df, store
+        self.interval, self.stop_after, self.keep_days = interval, stop_after, keep_days
+        self.on_change, self.seen_path = on_change, seen_path
+        self.seen = load_seen_ids(seen_path)
+        if df is not None and not df.empty: self.seen |= set(df["rec_idx"].astype(str))
+        self.stopped = threading.Event()
+
+    def poll(self):
+        with METRICS.stage("watch_poll"):
+            new_jobs, requested, pages = self.crawler.fetch_new(self.seen, self.stop_after)
+        METRICS.count("watch_polls"); METRICS.count("watch_pages", requested)
+        if not new_jobs: return 0
+        METRICS.count("watch_new", len(new_jobs))
+        self.df = merge_new(self.df, new_jobs, self.keep_days)
+        if self.store is not None:
+            run_id = self.store.start_run()
+            self.store.upsert(self.df, run_id)
+            source = self.store.run_name(run_id)
+        else:
+            source = results_csv_name()
+            self.df.to_csv(source, index=False, encoding="utf-8-sig")
+            clean_old_csv()
+        # 결과를 쓴 뒤에만 "본 공고"로 — 그 전에 실패하면 다음 확인에서 다시 받음
+        self.seen.update(j.rec_idx for j in new_jobs)
+        save_seen_ids(self.seen_path, self.seen)
+        print(f"🆕 {datetime.now():%H:%M:%S} 새 공고 {len(new_jobs)}건 ({requested}/{pages}페이지 확인) → {source}")
+        if self.on_change:
+            # 후속 단계가 실패해도 감시는 계속
+            try:
+                with METRICS.stage("watch_on_change"): self.on_change(self.df, source)
+            except Exception as e:
+                print(f"❌ 후속 단계 오류: {e}")
+        return len(new_jobs)
+
+    def stop(self, *_):
+        self.stopped.set()
+
+    # max_cycles: 테스트용 확인 횟수 제한. SIGTERM/Ctrl+C 면 다음 대기에서 바로 종료
+    def run(self, max_cycles=None):
+        if threading.current_thread() is threading.main_thread():
+            signal.signal(signal.SIGTERM, self.stop)
+        print(f"👀 감시 시작: {self.interval}s 간격, 알고 있는 공고 {len(self.seen)}건")
+        cycle, failures = 0, 0
+        try:
+            while not self.stopped.is_set():
+                cycle += 1
+                try:
+                    self.poll(); failures = 0
+                except (RequestFailed, requests.RequestException, ValueError) as e:
+                    failures += 1
+                    print(f"⚠️ 확인 실패 ({failures}회 연속): {e}")
+                if max_cycles is not None and cycle >= max_cycles: break
+                # 여러 감시자가 같은 순간에 몰리지 않도록 ±10% 지터, 실패가 이어지면 간격을 늘림
+                wait = self.interval * min(2 ** failures, MAX_BACKOFF) * random.uniform(0.9, 1.1)
+                self.stopped.wait(wait)
+        except KeyboardInterrupt:
+            pass
+        print(f"👋 감시 종료: {cycle}회 확인")